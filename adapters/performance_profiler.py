@@ -257,11 +257,7 @@ class PerformanceProfiler:
             payload_size = len(result) if isinstance(result, (bytes, str)) else 0
             
             # Store metrics
-            with self._lock:
-                if operation_name not in self.serialization_metrics:
-                    self.serialization_metrics[operation_name] = SerializationMetrics(operation_name)
-                
-                self.serialization_metrics[operation_name].add_measurement(execution_time, payload_size)
+            self.record_serialization(operation_name, execution_time, payload_size)
             
             return result, execution_time
             
@@ -270,6 +266,15 @@ class PerformanceProfiler:
             print(f"[PerformanceProfiler] Error in {operation_name}: {e}")
             raise
     
+    def record_serialization(self, operation_name: str, execution_time_ms: float,
+                             payload_size_bytes: int = 0) -> None:
+        """Record a serialization measurement that was timed by the caller."""
+        with self._lock:
+            if operation_name not in self.serialization_metrics:
+                self.serialization_metrics[operation_name] = SerializationMetrics(operation_name)
+            
+            self.serialization_metrics[operation_name].add_measurement(execution_time_ms, payload_size_bytes)
+    
     def compare_serializers(self, test_data: Any, iterations: int = 100) -> Dict[str, SerializationMetrics]:
         """
         Compare different serialization methods for the same data.
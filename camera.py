@@ -1,7 +1,7 @@
 # import the necessary packages
 import datetime
 import time  # required for VideoFileStream delay handling
-from threading import Thread
+from threading import Thread, Event
 import cv2
 import pyrealsense2 as rs
 import numpy as np
@@ -100,6 +100,8 @@ class WebcamVideoStream:
 		# be stopped
 		self.stopped = False
 		self.wasFrameRead = False
+		self._frame_ready = Event()  # set per new frame; readNext() waits on it
+		self._frame_ready.set()
 		
         
 	def start(self):
@@ -117,6 +119,7 @@ class WebcamVideoStream:
 			# otherwise, read the next frame from the stream
 			(self.grabbed, self.frame) = self.stream.read()
 			self.wasFrameRead = False
+			self._frame_ready.set()
 			time.sleep(self._delay)
 			
 	def read(self):
@@ -128,10 +131,10 @@ class WebcamVideoStream:
 	
 	def readNext(self):
 		"""Block until a *new* frame becomes available and return it in grayscale."""
-		while True:
-			if(not self.wasFrameRead):
-				self.wasFrameRead = True
-				return cv2.cvtColor(self.frame, cv2.COLOR_BGR2GRAY)
+		self._frame_ready.wait()
+		self._frame_ready.clear()
+		self.wasFrameRead = True
+		return cv2.cvtColor(self.frame, cv2.COLOR_BGR2GRAY)
 			
 	def stop(self):
 		"""Signal the background thread to terminate."""
@@ -253,6 +256,8 @@ class RealsenseStream:
 
 		self.stopped = False
 		self.wasFrameRead = False
+		self._frame_ready = Event()  # set per new frame; readNext() waits on it
+		self._frame_ready.set()
         
 	def start(self):
 		"""Spawn the background frame fetch thread."""
@@ -315,6 +320,7 @@ class RealsenseStream:
 				self._points = None
 				
 			self.wasFrameRead = False
+			self._frame_ready.set()
 			
 	def read(self):
 		"""Return the *latest* infrared frame (*rs.frame*)."""
@@ -322,10 +328,10 @@ class RealsenseStream:
 	
 	def readNext(self):
 		"""Block until a **new** IR frame arrives and return it as a NumPy array."""
-		while True:
-			if(not self.wasFrameRead):
-				self.wasFrameRead = True
-				return np.asanyarray(self.ir_frame.get_data())
+		self._frame_ready.wait()
+		self._frame_ready.clear()
+		self.wasFrameRead = True
+		return np.asanyarray(self.ir_frame.get_data())
 	
 	def stop(self):
 		"""Signal the background thread to terminate."""
@@ -730,6 +736,8 @@ class VideoFileStream:
 
 		self.stopped = False
 		self.wasFrameRead = False
+		self._frame_ready = Event()  # set per new frame; readNext() waits on it
+		self._frame_ready.set()
 
 	def start(self):
 		Thread(target=self.update, args=(), daemon=True).start()
@@ -746,16 +754,17 @@ class VideoFileStream:
 				continue
 			self.frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
 			self.wasFrameRead = False
+			self._frame_ready.set()
 			time.sleep(self._delay)
 
 	def read(self):
 		return self.frame
 
 	def readNext(self):
-		while True:
-			if not self.wasFrameRead:
-				self.wasFrameRead = True
-				return self.frame
+		self._frame_ready.wait()
+		self._frame_ready.clear()
+		self.wasFrameRead = True
+		return self.frame
 
 	def stop(self):
 		self.stopped = True
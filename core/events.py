@@ -7,11 +7,14 @@ without creating coupling between producers and consumers.
 """
 
 from dataclasses import dataclass
-from typing import List, Optional, Tuple, Any
+from typing import TYPE_CHECKING, List, Optional, Tuple, Any
 import time
 
+if TYPE_CHECKING:
+    import numpy as np
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class BeyData:
     """Immutable representation of a tracked Beyblade."""
     id: int
@@ -23,7 +26,7 @@ class BeyData:
     frame: int
 
 
-@dataclass(frozen=True) 
+@dataclass(frozen=True, slots=True)
 class HitData:
     """Immutable representation of a collision event."""
     pos: Tuple[int, int]
@@ -34,13 +37,39 @@ class HitData:
 
 # ==================== TRACKING SERVICE EVENTS ==================== #
 
+# Column layout of TrackingDataUpdated.beys_np
+BEY_ARRAY_COLUMNS = ('id', 'x', 'y', 'vx', 'vy', 'ax', 'ay', 'frame')
+
+
+def pack_bey_array(ids, x, y, vx, vy, ax, ay, frame) -> 'np.ndarray':
+    """
+    Pack per-bey columns into the (N, 8) float32 layout of TrackingDataUpdated.beys_np.
+    
+    Each argument is a length-N sequence or a scalar shared by every bey, in
+    the column order of BEY_ARRAY_COLUMNS.
+    """
+    import numpy as np
+    
+    arr = np.empty((len(ids), len(BEY_ARRAY_COLUMNS)), dtype=np.float32)
+    for col, values in enumerate((ids, x, y, vx, vy, ax, ay, frame)):
+        arr[:, col] = values
+    return arr
+
+
 @dataclass(frozen=True)
 class TrackingDataUpdated:
-    """Published by TrackingService when new frame data is available."""
+    """
+    Published by TrackingService when new frame data is available.
+    
+    ``beys_np`` optionally carries the same beys as one contiguous float32
+    array of shape (N, 8), columns as in BEY_ARRAY_COLUMNS, so consumers can
+    batch-transform positions without walking the BeyData objects.
+    """
     frame_id: int
     beys: List[BeyData]
     hits: List[HitData] 
     timestamp: float = None
+    beys_np: Optional['np.ndarray'] = None
     
     def __post_init__(self):
         if self.timestamp is None:
@@ -85,7 +114,7 @@ class TrackingError:
 
 # ==================== GUI SERVICE EVENTS ==================== #
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChangeTrackerSettings:
     """Published by GUI when user changes detection parameters."""
     threshold: Optional[int] = None
@@ -99,6 +128,13 @@ class ChangeTrackerSettings:
     def __post_init__(self):
         if self.timestamp is None:
             object.__setattr__(self, 'timestamp', time.perf_counter())
+    
+    def changed_fields(self) -> List[Tuple[str, Any]]:
+        """Return (name, value) pairs for the settings that were explicitly set."""
+        return [
+            (name, value) for name in self.__slots__
+            if name != 'timestamp' and (value := getattr(self, name)) is not None
+        ]
 
 
 @dataclass(frozen=True)
@@ -144,6 +180,17 @@ class ChangeCropSettings:
             object.__setattr__(self, 'timestamp', time.perf_counter())
 
 
+@dataclass(frozen=True)
+class ChangeDisplaySettings:
+    """Published by GUI when the tracking preview becomes visible or hidden."""
+    enabled: bool
+    timestamp: float = None
+    
+    def __post_init__(self):
+        if self.timestamp is None:
+            object.__setattr__(self, 'timestamp', time.perf_counter())
+
+
 @dataclass(frozen=True)
 class CalibrateTracker:
     """Published by GUI to request tracker calibration."""
@@ -225,7 +272,7 @@ class SystemShutdown:
             object.__setattr__(self, 'timestamp', time.perf_counter())
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PerformanceMetric:
     """Published for performance monitoring and optimization."""
     metric_name: str
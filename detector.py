@@ -4,7 +4,6 @@ import numpy as np
 import cv2
 import itertools
 from objects import Contour, Bey, Hit
-import math
 
 # Path where CalibrationWizard persists the last-used profile
 _CONFIG_DIR = Path.home() / ".beytracker"
@@ -44,13 +43,25 @@ class Detector:
         imgs = np.stack(imgs)
         self.mean_img = np.mean(imgs, axis=0)
         self.std_img = np.std(imgs, axis=0) + 1e-16
+        self._thr_std_for = None  # threshold * std_img is rebuilt on the next detect()
         print("")
     
     def detect(self, ir_img:np.ndarray) -> tuple[list[Bey], list[Hit]]:
         
-        z = (ir_img - self.mean_img) / self.std_img
-        thresh = np.zeros_like(ir_img, dtype = np.uint8)
-        thresh[z >= self.threshold] = 255
+        #z値の閾値処理: std > 0 なので (img - mean) / std >= t を img - mean >= t * std として比較する
+        if ir_img.ndim == 2:
+            if getattr(self, "_thr_std_for", None) != self.threshold:
+                self._thr_std = self.threshold * self.std_img
+                self._thr_std_for = self.threshold
+            diff = getattr(self, "_diff_buf", None)
+            if diff is None or diff.shape != ir_img.shape:
+                diff = self._diff_buf = np.empty(ir_img.shape, dtype=np.float64)
+            np.subtract(ir_img, self.mean_img, out=diff)
+            thresh = cv2.compare(diff, self._thr_std, cv2.CMP_GE)
+        else:
+            z = (ir_img - self.mean_img) / self.std_img
+            thresh = np.zeros_like(ir_img, dtype = np.uint8)
+            thresh[z >= self.threshold] = 255
 
         #cv2.imshow("thresh", thresh)
         kernel = np.ones((3,3),np.uint8)
@@ -93,7 +104,9 @@ class Detector:
         
         hits = []
         for bey1, bey2 in itertools.combinations(beys, 2):
-            if math.dist(bey1.getPos(), bey2.getPos()) < 40:
+            # 距離40未満を二乗で判定（sqrtを省く）
+            (x1, y1), (x2, y2) = bey1.getPos(), bey2.getPos()
+            if (x1 - x2) ** 2 + (y1 - y2) ** 2 < 40 * 40:
                 hit = Hit(bey1, bey2)
                 hit.setShape((2*abs(bey1.x - bey2.x), 2*abs(bey1.y - bey2.y)))
                 hits.append(hit)
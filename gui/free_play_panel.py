@@ -16,8 +16,10 @@ from PySide6.QtWidgets import (
     QGridLayout, QMessageBox
 )
 
+from .navigation import NavigationCallbacksMixin
 
-class FreePlayPage(QWidget):
+
+class FreePlayPage(NavigationCallbacksMixin, QWidget):
     """Free Play Mode gaming interface with score tracking and game controls."""
     
     def __init__(self, status_cb):
@@ -516,6 +518,13 @@ class FreePlayPage(QWidget):
         """Set the calibration navigation callback."""
         self.cb_open_calibration = callback
     
+    NAV_CALLBACK_SETTERS = {
+        "system_hub": set_system_hub_callback,
+        "tracker": set_tracker_callback,
+        "projection": set_projection_callback,
+        "calibration": set_calibration_callback,
+    }
+    
     def showEvent(self, event):
         """Handle show event."""
         super().showEvent(event)
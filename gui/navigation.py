@@ -0,0 +1,30 @@
+"""
+Shared navigation-callback wiring for the BBAN-Tracker GUI pages.
+
+Pages expose one ``set_<target>_callback`` setter per navigation target and
+list them in ``NAV_CALLBACK_SETTERS``; ``NavigationCallbacksMixin`` adds a
+``set_callbacks`` method that wires several of them in one call.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, ClassVar, Dict
+
+
+class NavigationCallbacksMixin:
+    """Adds ``set_callbacks`` on top of a page's per-target callback setters."""
+
+    # Navigation target name -> the page's setter for it
+    NAV_CALLBACK_SETTERS: ClassVar[Dict[str, Callable]] = {}
+
+    def set_callbacks(self, callbacks: Dict[str, Callable]):
+        """Set several navigation callbacks at once, e.g. ``{"tracker": cb}``.
+
+        Raises KeyError, before setting anything, if a name is not one of
+        ``NAV_CALLBACK_SETTERS``.
+        """
+        unknown = [name for name in callbacks if name not in self.NAV_CALLBACK_SETTERS]
+        if unknown:
+            raise KeyError(f"Unknown navigation callback(s): {', '.join(unknown)}")
+        for name, callback in callbacks.items():
+            self.NAV_CALLBACK_SETTERS[name](self, callback)
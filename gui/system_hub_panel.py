@@ -12,8 +12,10 @@ from typing import Optional, Callable
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
 
+from .navigation import NavigationCallbacksMixin
 
-class SystemHubPage(QWidget):
+
+class SystemHubPage(NavigationCallbacksMixin, QWidget):
     """Simple hub routing to various setup screens."""
 
     def __init__(self):
@@ -32,9 +34,10 @@ class SystemHubPage(QWidget):
         layout = QVBoxLayout(self)
         
         # Title
-        title = QLabel("BeysionXR Kiosk – System Hub")
-        title.setStyleSheet("font-size:36px;font-weight:bold;color:#90EE90; padding: 10px;")
-        layout.addWidget(title, alignment=Qt.AlignLeft)
+        self.title_label = QLabel("BeysionXR Kiosk – System Hub")
+        self.title_label.setObjectName("title_label")
+        self.title_label.setStyleSheet("font-size:36px;font-weight:bold;color:#90EE90; padding: 10px;")
+        layout.addWidget(self.title_label, alignment=Qt.AlignLeft)
 
         # Button row
         btn_row = QHBoxLayout()
@@ -135,4 +138,12 @@ class SystemHubPage(QWidget):
 
     def set_free_play_callback(self, callback: Callable):
         """Set the free play navigation callback."""
-        self.cb_open_free_play = callback 
\ No newline at end of file
+        self.cb_open_free_play = callback 
+
+    NAV_CALLBACK_SETTERS = {
+        "calibration": set_calibration_callback,
+        "options": set_options_callback,
+        "projection": set_projection_callback,
+        "tracker": set_tracker_callback,
+        "free_play": set_free_play_callback,
+    }
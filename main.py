@@ -89,15 +89,19 @@ def processNetwork(tcp_server, tcp_client_socket, detector, image_getter):
             return None
     return tcp_client_socket
 
-def drawResults(ir_img: np.ndarray, beys: list, hits: list, registry: Registry):
+def drawResults(ir_img: np.ndarray, beys: list, hits: list, registry: Registry, with_trail_view: bool = True, out: np.ndarray | None = None):
     """
     検出されたコマ（Bey）や衝突（Hit）の情報を画像上に描画する。
     複数の描画用ウィンドウ（result, result2）を生成する。
+    with_trail_view=False の場合は result2 を作らず None を返す（GUI は result のみ使用）。
+    out を渡すと result をその配列に書き込む（形状が合わなければ新規確保）。
     """
-    result = cv2.cvtColor(ir_img, cv2.COLOR_GRAY2BGR)
-    result2 = np.zeros_like(result)
-    result2[:, :, 0] = 255
-    result2[5:-5, 5:-5, 0] = 0
+    result = cv2.cvtColor(ir_img, cv2.COLOR_GRAY2BGR, dst=out)
+    result2 = None
+    if with_trail_view:
+        result2 = np.zeros_like(result)
+        result2[:, :, 0] = 255
+        result2[5:-5, 5:-5, 0] = 0
 
     # コマの矩形描画
     for bey in beys:
@@ -106,25 +110,33 @@ def drawResults(ir_img: np.ndarray, beys: list, hits: list, registry: Registry):
         cv2.rectangle(result, pos1, pos2, color, 2)
     
     # 軌跡描画（直近フレームからの履歴を利用）
-    pre_poses: dict[int, tuple[int, int]] = {}
+    # IDごとに座標をまとめ、線分ごとではなく1本の折れ線として一度に描く
+    trails: dict[int, list[tuple[int, int]]] = {}
     for beys_frame in registry.getBeyList():
         for bey in beys_frame:
-            pos = bey.getPos()
-            id = bey.getId()
-            if id in pre_poses:
-                cv2.line(result, pre_poses[id], pos, BEY_COLORS[id % len(BEY_COLORS)], thickness=2)
-                cv2.line(result2, pre_poses[id], pos, BEY_COLORS[id % len(BEY_COLORS)], thickness=2)
-            pre_poses[id] = pos
+            trails.setdefault(bey.getId(), []).append(bey.getPos())
+    for id, poses in trails.items():
+        if len(poses) < 2:
+            continue
+        pts = [np.array(poses, dtype=np.int32)]
+        color = BEY_COLORS[id % len(BEY_COLORS)]
+        cv2.polylines(result, pts, False, color, thickness=2)
+        if result2 is not None:
+            cv2.polylines(result2, pts, False, color, thickness=2)
 
     # 衝突部分の描画
     for hit in hits:
         pos1, pos2 = hit.getRect()
         cv2.rectangle(result, pos1, pos2, HIT_COLOR, 2)
-    for hits_frame in registry.getHitList()[-5:]:
+    # 直近5フレーム分だけを走査する（getHitList() は全20フレーム分を複製するため使わない）
+    for hits_frame in registry.hit_list[-5:]:
         for hit in hits_frame:
+            if not hit.isNewHit():
+                continue
             pos = hit.getPos()
             cv2.circle(result, pos, 8, HIT_COLOR, thickness=-1)
-            cv2.circle(result2, pos, 8, HIT_COLOR, thickness=-1)
+            if result2 is not None:
+                cv2.circle(result2, pos, 8, HIT_COLOR, thickness=-1)
     
     return result, result2
 
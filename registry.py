@@ -30,6 +30,19 @@ class Registry:
         return message
     
 
+    # getMessage() と同じ内容を str を経由せずに bytes で直接組み立てる（UDP送信用）
+    def getMessageBytes(self) -> bytes:
+        parts = [b"%d, beys:" % self.frame_count]
+        for bey in self.bey_list[-1]:
+            x, y = bey.getPos()
+            parts.append(b"(%a, %a, %a)" % (bey.getId(), x, y))
+        parts.append(b", hits:")
+        for hit in self.hit_list[-1]:
+            if hit.isNewHit():
+                parts.append(b"(%a, %a)" % hit.getPos())
+        return b"".join(parts)
+    
+
     def register(self, beys:list[Bey], hits:list[Hit]):
         for bey in beys: bey.setFrame(self.frame_count)
         self.__setBeyId(beys)
@@ -18,7 +18,7 @@ from ..core.events import (
     ProjectionClientConnected, ProjectionClientDisconnected,
     PerformanceMetric, SystemShutdown,
     StartTracking, StopTracking, ChangeTrackerSettings, ChangeRealSenseSettings,
-    ChangeCropSettings, CalibrateTracker, ProjectionConfigUpdated
+    ChangeCropSettings, ChangeDisplaySettings, CalibrateTracker, ProjectionConfigUpdated
 )
 
 # Import our modular UI panels
@@ -178,6 +178,8 @@ class GUIService(IGUIService):
         if self._main_window and page_name in self._panels:
             self._current_page = page_name
             self._main_window.show_page(page_name)
+            # Only the tracker page shows the annotated preview
+            self._event_broker.publish(ChangeDisplaySettings(enabled=page_name == 'tracker_setup'))
             self._notify_page_update()
             print(f"[GUIService] Switched to page: {page_name}")
     
@@ -185,6 +187,10 @@ class GUIService(IGUIService):
         """Return the name of the currently active page."""
         return self._current_page
     
+    def reset_panels_state(self) -> None:
+        """Return to the System Hub without rebuilding any panel."""
+        self.show_page("system_hub")
+    
     def show_notification(self, message: str, duration_ms: int = 3000) -> None:
         """Display a transient notification to the user."""
         if self._gui_bridge:
@@ -565,7 +571,10 @@ class GUIService(IGUIService):
     def _open_calibration_wizard(self):
         """Open the calibration wizard."""
         if self._main_window:
+            # The modal wizard previews the tracking frames whichever page is open
+            self._event_broker.publish(ChangeDisplaySettings(enabled=True))
             self._main_window.open_calibration_wizard_global()
+            self._event_broker.publish(ChangeDisplaySettings(enabled=self._current_page == 'tracker_setup'))
     
     def _notify_page_update(self) -> None:
         """Notify about page state changes."""
@@ -6,21 +6,87 @@ tracking data events. It operates independently of the GUI and projection
 services, communicating only through the event broker.
 """
 
+from __future__ import annotations
+
+from collections import deque
+import copy
 import time
 import threading
-from typing import Optional, Dict, Any
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Optional, Dict, Any
 from threading import Event
 
+import numpy as np
+
 from ..core.interfaces import ITrackingService, ITrackerHardware, IEventBroker
 from ..core.events import (
     TrackingDataUpdated, TrackingStarted, TrackingStopped, TrackingError,
-    ChangeTrackerSettings, ChangeRealSenseSettings, ChangeCropSettings,
+    ChangeTrackerSettings, ChangeRealSenseSettings, ChangeCropSettings, ChangeDisplaySettings,
     CalibrateTracker, StartTracking, StopTracking, SystemShutdown,
-    PerformanceMetric, BeyData, HitData
+    PerformanceMetric, BeyData, HitData, pack_bey_array
 )
-from ..detector import Detector
-from ..registry import Registry
-from ..objects import Bey, Hit
+
+if TYPE_CHECKING:
+    # Detection stack is imported lazily where it is used to keep service
+    # construction cheap (headless tests instantiate services repeatedly)
+    from ..detector import Detector
+    from ..registry import Registry
+
+
+# Upper bound on the number of beys MockTrackingService simulates
+MAX_MOCK_BEYS = 8
+
+
+@dataclass
+class MockBeySoA:
+    """Simulated beys stored as parallel NumPy columns (one entry per bey)."""
+    ids: np.ndarray
+    pos_x: np.ndarray
+    pos_y: np.ndarray
+    vel_x: np.ndarray
+    vel_y: np.ndarray
+    angular_vel: np.ndarray
+    spin_decay: np.ndarray
+    last_hit_time: np.ndarray
+    size: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    @classmethod
+    def empty(cls) -> MockBeySoA:
+        empty = np.zeros(0, dtype=np.float64)
+        return cls(np.zeros(0, dtype=np.int32), *(empty.copy() for _ in range(8)))
+
+
+def _resolve_collision(vx1, vy1, vx2, vy2, nx, ny, distance, size1, size2):
+    """
+    Equal-mass elastic collision along the unit normal (nx, ny).
+    
+    Returns the updated velocities and the separation (sep_x, sep_y) to add to
+    bey 1 and subtract from bey 2. Beys that are already moving apart are
+    returned unchanged.
+    """
+    # Relative velocity along collision normal
+    dvn = (vx1 - vx2) * nx + (vy1 - vy2) * ny
+    
+    # Only resolve if objects are approaching
+    if dvn > 0:
+        return vx1, vy1, vx2, vy2, 0.0, 0.0
+    
+    # Collision impulse (equal masses) plus some energy to make hits more dramatic
+    impulse_x = dvn * nx
+    impulse_y = dvn * ny
+    energy_boost = 1.2
+    vx1 = (vx1 - impulse_x) * energy_boost
+    vy1 = (vy1 - impulse_y) * energy_boost
+    vx2 = (vx2 + impulse_x) * energy_boost
+    vy2 = (vy2 + impulse_y) * energy_boost
+    
+    # Separate overlapping beys
+    overlap = (size1 + size2) - distance
+    separation = overlap / 2 if overlap > 0 else 0.0
+    return vx1, vy1, vx2, vy2, nx * separation, ny * separation
 
 
 class TrackingService(ITrackingService):
@@ -60,11 +126,30 @@ class TrackingService(ITrackingService):
         self._crop_enabled = True
         self._crop_rect = ((150, 15), (500, 350))  # Default from main.py
         self._invert_ir = False
+        self._settings_cache: Optional[dict] = None  # see get_current_settings
+        self._settings_cache_ts = 0.0
+        self._display_enabled = True  # forwarded to the worker, see set_display_enabled
         
         # Performance monitoring
         self._start_time = 0.0
-        self._last_perf_report = 0.0
-        self._frame_times = []
+        self._frame_times: deque[float] = deque(maxlen=100)
+        self._frame_times_lock = threading.Lock()
+        self._perf_thread: Optional[threading.Thread] = None
+        self._perf_stop = Event()  # per-thread stop, set by _stop_perf_thread()
+        # Templates for the periodic metrics; only value/timestamp change per publish
+        self._perf_fps_evt = PerformanceMetric("tracking_fps", 0.0, "fps", "TrackingService")
+        self._perf_frame_time_evt = PerformanceMetric("frame_processing_time", 0.0, "ms", "TrackingService")
+        
+        # TrackingDataUpdated hand-off: the tracking thread appends, the
+        # dispatch thread publishes. Oldest frames are dropped if subscribers lag.
+        self._pending_tracking: deque[TrackingDataUpdated] = deque(maxlen=8)
+        self._tracking_ready = Event()
+        self._dispatch_thread: Optional[threading.Thread] = None
+        self._dispatch_stop = Event()  # per-thread stop, set by _stop_dispatch_thread()
+        
+        # Error-burst state for the monitoring loop (backoff + dedupe)
+        self._consecutive_errors = 0
+        self._last_error_hash: Optional[int] = None
         
         # Subscribe to relevant events
         self._setup_event_subscriptions()
@@ -76,6 +161,7 @@ class TrackingService(ITrackingService):
         self._event_broker.subscribe(ChangeTrackerSettings, self._handle_tracker_settings)
         self._event_broker.subscribe(ChangeRealSenseSettings, self._handle_realsense_settings)
         self._event_broker.subscribe(ChangeCropSettings, self._handle_crop_settings)
+        self._event_broker.subscribe(ChangeDisplaySettings, self._handle_display_settings)
         self._event_broker.subscribe(CalibrateTracker, self._handle_calibrate)
         self._event_broker.subscribe(SystemShutdown, self._handle_shutdown)
     
@@ -125,7 +211,16 @@ class TrackingService(ITrackingService):
             return {'status': 'error', 'error': str(e)}
     
     def get_current_settings(self) -> dict:
-        """Return current tracking and camera settings."""
+        """Return current tracking and camera settings.
+        
+        The snapshot is cached for 250 ms (and dropped by every settings
+        handler) so periodic GUI polls do not query each hardware option.
+        Callers get a deep copy, so mutating it never touches the cache.
+        """
+        now = time.perf_counter()
+        if self._settings_cache is not None and now - self._settings_cache_ts < 0.25:
+            return copy.deepcopy(self._settings_cache)
+        
         settings = {
             'crop_enabled': self._crop_enabled,
             'crop_rect': self._crop_rect,
@@ -152,8 +247,10 @@ class TrackingService(ITrackingService):
                 settings['hardware'] = hw_current
             except Exception:
                 pass
-                
-        return settings
+        
+        self._settings_cache = settings
+        self._settings_cache_ts = now
+        return copy.deepcopy(settings)
     
     def get_latest_frame_info(self) -> Optional[dict]:
         """Return metadata about the most recent processed frame."""
@@ -166,6 +263,12 @@ class TrackingService(ITrackingService):
             'average_fps': self._calculate_fps()
         }
     
+    def set_display_enabled(self, enabled: bool) -> None:
+        """Let the GUI turn preview rendering off while no view is showing it."""
+        self._display_enabled = bool(enabled)
+        if hasattr(self, '_tracking_worker') and self._tracking_worker:
+            self._tracking_worker.set_display_enabled(self._display_enabled)
+    
     # ==================== EVENT HANDLERS ==================== #
     
     def _handle_start_tracking(self, event: StartTracking) -> None:
@@ -186,6 +289,8 @@ class TrackingService(ITrackingService):
                 video_path=event.video_path
             )
             
+            self._tracking_worker.set_display_enabled(self._display_enabled)
+            
             # Check for initialization errors
             if self._tracking_worker.error_msg:
                 self._event_broker.publish(TrackingError(
@@ -206,7 +311,9 @@ class TrackingService(ITrackingService):
                 name="TrackingService-Monitor"
             )
             self._start_time = time.perf_counter()
+            self._start_dispatch_thread()
             self._monitoring_thread.start()
+            self._start_perf_thread()
             
             # Publish success event
             camera_type = "RealSense" if not event.dev_mode else "Webcam"
@@ -228,21 +335,20 @@ class TrackingService(ITrackingService):
     
     def _handle_tracker_settings(self, event: ChangeTrackerSettings) -> None:
         """Handle changes to tracker detection settings."""
+        self._settings_cache = None
+        changed = dict(event.changed_fields())
+        
         # Update TrackingWorker settings if it exists
         if hasattr(self, '_tracking_worker') and self._tracking_worker:
             try:
-                if event.threshold is not None:
-                    self._tracking_worker.set_threshold(event.threshold)
-                if event.min_area is not None:
-                    self._tracking_worker.set_min_area(event.min_area)
-                if event.max_area is not None:
-                    self._tracking_worker.set_max_area(event.max_area)
-                if event.invert_ir is not None:
-                    self._tracking_worker.set_invert_ir(event.invert_ir)
-                if event.smoothing_alpha is not None:
+                smoothing_alpha = changed.pop('smoothing_alpha', None)
+                if smoothing_alpha is not None:
                     # Apply globally since objects module handles this
                     from ..objects import set_smoothing_alpha
-                    set_smoothing_alpha(event.smoothing_alpha)
+                    set_smoothing_alpha(smoothing_alpha)
+                if changed:
+                    # Single swap of the worker's TrackerConfig, read once per frame
+                    self._tracking_worker.update_config(**changed)
             except Exception as e:
                 print(f"[TrackingService] Error applying tracker settings: {e}")
                 
@@ -252,6 +358,7 @@ class TrackingService(ITrackingService):
     
     def _handle_realsense_settings(self, event: ChangeRealSenseSettings) -> None:
         """Handle changes to RealSense camera settings."""
+        self._settings_cache = None
         if not hasattr(self, '_tracking_worker') or not self._tracking_worker:
             return
             
@@ -283,9 +390,14 @@ class TrackingService(ITrackingService):
     
     def _handle_crop_settings(self, event: ChangeCropSettings) -> None:
         """Handle changes to crop settings."""
+        self._settings_cache = None
         self._crop_enabled = event.enabled
         self._crop_rect = ((event.x1, event.y1), (event.x2, event.y2))
     
+    def _handle_display_settings(self, event: ChangeDisplaySettings) -> None:
+        """Handle the GUI showing or hiding the tracking preview."""
+        self.set_display_enabled(event.enabled)
+    
     def _handle_calibrate(self, event: CalibrateTracker) -> None:
         """Handle calibration request."""
         if not hasattr(self, '_tracking_worker') or not self._tracking_worker:
@@ -311,60 +423,67 @@ class TrackingService(ITrackingService):
         """Monitor the TrackingWorker and bridge its data to EDA events."""
         print("[TrackingService] Monitoring loop started")
         
+        # Bind hot-path lookups once; the loop body runs at frame rate
+        stop_set = self._stop_event.is_set
+        worker = self._tracking_worker
+        worker_alive = worker.is_alive
+        publish = self._event_broker.publish
+        queue_tracking = self._pending_tracking.append
+        tracking_ready = self._tracking_ready.set
+        record_frame_time = self._frame_times.append
+        frame_times_lock = self._frame_times_lock
+        now = time.perf_counter
+        sleep = time.sleep
+        
+        last_event = None
         try:
-            while not self._stop_event.is_set() and self._tracking_worker.is_alive():
-                loop_start = time.perf_counter()
+            while not stop_set() and worker_alive():
+                loop_start = now()
                 
                 try:
-                    # Get current frame from TrackingWorker
-                    current_frame = self._tracking_worker.current_frame
-                    beys = self._tracking_worker.beys
-                    hits = self._tracking_worker.hits
-                    
-                    if current_frame is not None and beys is not None:
-                        # Convert tracking objects to immutable event data
-                        bey_data = [self._bey_to_data(bey) for bey in beys]
-                        hit_data = [self._hit_to_data(hit) for hit in hits] if hits else []
-                        
-                        # Publish tracking data event
-                        self._event_broker.publish(TrackingDataUpdated(
-                            frame_id=self._frame_count,
-                            beys=bey_data,
-                            hits=hit_data
-                        ))
-                        
+                    # The worker builds each frame's event while registering it;
+                    # forward every new one exactly once.
+                    event = worker.latest_event
+                    if event is not None and event is not last_event:
+                        queue_tracking(event)
+                        tracking_ready()
+                        last_event = event
                         self._frame_count += 1
                     
-                    # Performance monitoring
-                    frame_time = time.perf_counter() - loop_start
-                    self._frame_times.append(frame_time)
-                    if len(self._frame_times) > 100:
-                        self._frame_times.pop(0)
-                    
-                    # Publish performance metrics periodically
-                    if time.perf_counter() - self._last_perf_report > 5.0:
-                        self._publish_performance_metrics()
-                        self._last_perf_report = time.perf_counter()
+                    # Performance monitoring (published by the perf thread)
+                    frame_time = now() - loop_start
+                    with frame_times_lock:
+                        record_frame_time(frame_time)
                     
                     # Check for TrackingWorker errors
-                    if self._tracking_worker.error_msg:
-                        self._event_broker.publish(TrackingError(
-                            error_message=self._tracking_worker.error_msg,
+                    if worker.error_msg:
+                        publish(TrackingError(
+                            error_message=worker.error_msg,
                             error_type="detection_error",
                             recoverable=True
                         ))
                     
+                    # Frame handled cleanly - end of any error burst
+                    self._consecutive_errors = 0
+                    self._last_error_hash = None
+                    
                     # Small sleep to prevent excessive CPU usage
-                    time.sleep(0.01)  # ~100 FPS max monitoring rate
+                    sleep(0.01)  # ~100 FPS max monitoring rate
                         
                 except Exception as e:
-                    self._event_broker.publish(TrackingError(
-                        error_message=f"Monitoring loop error: {e}",
-                        error_type="detection_error",
-                        recoverable=True
-                    ))
-                    # Brief pause before continuing
-                    time.sleep(0.1)
+                    # Recoverable: publish once per distinct error within a burst
+                    message = f"Monitoring loop error: {e}"
+                    error_hash = hash(message)
+                    if error_hash != self._last_error_hash:
+                        self._last_error_hash = error_hash
+                        self._event_broker.publish(TrackingError(
+                            error_message=message,
+                            error_type="detection_error",
+                            recoverable=True
+                        ))
+                    # Exponential backoff: 20 ms, 40 ms, ... capped at 2 s
+                    self._consecutive_errors = min(self._consecutive_errors + 1, 8)
+                    time.sleep(min(2.0, 0.01 * 2 ** self._consecutive_errors))
                     
         except Exception as e:
             self._event_broker.publish(TrackingError(
@@ -372,7 +491,12 @@ class TrackingService(ITrackingService):
                 error_type="detection_error", 
                 recoverable=False
             ))
+            # Don't leave the capture thread running without a monitor
+            self._stop_worker(worker)
         finally:
+            # Whatever ended the loop, its helper threads end with it
+            self._stop_perf_thread()
+            self._stop_dispatch_thread()
             self._cleanup_tracking()
             print("[TrackingService] Monitoring loop stopped")
     
@@ -385,11 +509,7 @@ class TrackingService(ITrackingService):
         
         # Stop the TrackingWorker if it exists
         if hasattr(self, '_tracking_worker') and self._tracking_worker:
-            try:
-                self._tracking_worker.stop_tracking()
-                self._tracking_worker.join(timeout=2.0)
-            except Exception as e:
-                print(f"[TrackingService] Error stopping TrackingWorker: {e}")
+            self._stop_worker(self._tracking_worker)
         
         # Stop the monitoring thread
         if hasattr(self, '_monitoring_thread') and self._monitoring_thread and self._monitoring_thread.is_alive():
@@ -397,10 +517,21 @@ class TrackingService(ITrackingService):
                 self._monitoring_thread.join(timeout=2.0)
             except Exception:
                 pass
+        
+        self._stop_perf_thread()
+        self._stop_dispatch_thread()
             
         self._cleanup_tracking()
         self._event_broker.publish(TrackingStopped(reason=reason))
     
+    def _stop_worker(self, worker) -> None:
+        """Stop *worker* and wait for its thread to exit."""
+        try:
+            worker.stop_tracking()
+            worker.join(timeout=2.0)
+        except Exception as e:
+            print(f"[TrackingService] Error stopping TrackingWorker: {e}")
+    
     def _cleanup_tracking(self) -> None:
         """Clean up tracking resources."""
         # Clean up TrackingWorker reference
@@ -413,73 +544,87 @@ class TrackingService(ITrackingService):
         self._tracking_thread = None
         self._frame_count = 0
     
-    def _warmup_camera(self) -> None:
-        """Warm up the camera by reading several frames."""
-        for _ in range(20):
-            try:
-                self._get_cropped_frame()
-            except Exception:
-                pass
-    
-    def _get_cropped_frame(self):
-        """Get a cropped frame for calibration/detection."""
-        frame = self._hardware.read_next_frame()
-        return self._apply_crop(frame)
-    
-    def _apply_crop(self, frame):
-        """Apply crop settings to a frame."""
-        if not self._crop_enabled or frame is None:
-            return frame
-            
-        (x1, y1), (x2, y2) = self._crop_rect
-        return frame[y1:y2, x1:x2].copy()
-    
-    def _bey_to_data(self, bey: Bey) -> BeyData:
-        """Convert a Bey object to immutable BeyData."""
-        return BeyData(
-            id=bey.getId(),
-            pos=bey.getPos(),
-            velocity=bey.getVel(),
-            raw_velocity=bey.getRawVel(),
-            acceleration=bey.getAcc(),
-            shape=bey.getShape(),
-            frame=bey.getFrame()
-        )
-    
-    def _hit_to_data(self, hit: Hit) -> HitData:
-        """Convert a Hit object to immutable HitData."""
-        bey1, bey2 = hit.getBeys()
-        return HitData(
-            pos=hit.getPos(),
-            shape=hit.getShape(),
-            bey_ids=(bey1.getId(), bey2.getId()),
-            is_new_hit=hit.isNewHit()
-        )
-    
     def _calculate_fps(self) -> float:
         """Calculate current FPS based on recent frame times."""
-        if not self._frame_times:
-            return 0.0
-        avg_frame_time = sum(self._frame_times) / len(self._frame_times)
+        with self._frame_times_lock:
+            if not self._frame_times:
+                return 0.0
+            avg_frame_time = sum(self._frame_times) / len(self._frame_times)
         return 1.0 / avg_frame_time if avg_frame_time > 0 else 0.0
     
+    def _start_dispatch_thread(self) -> None:
+        """Start the thread that publishes queued TrackingDataUpdated events."""
+        self._pending_tracking.clear()
+        self._tracking_ready.clear()
+        self._dispatch_stop = Event()
+        self._dispatch_thread = threading.Thread(
+            target=self._dispatch_loop,
+            args=(self._dispatch_stop,),
+            daemon=True,
+            name="TrackingService-Dispatch"
+        )
+        self._dispatch_thread.start()
+    
+    def _stop_dispatch_thread(self) -> None:
+        """Flush queued tracking data, stop the dispatch thread and wait for it."""
+        self._dispatch_stop.set()
+        # Wake the dispatcher so it flushes what is queued and exits
+        self._tracking_ready.set()
+        thread, self._dispatch_thread = self._dispatch_thread, None
+        if thread and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
+    
+    def _dispatch_loop(self, stop: Event) -> None:
+        """Publish queued tracking data so slow subscribers never stall tracking."""
+        pending = self._pending_tracking
+        publish = self._event_broker.publish
+        while True:
+            self._tracking_ready.wait(0.1)
+            self._tracking_ready.clear()
+            while pending:
+                try:
+                    publish(pending.popleft())
+                except Exception as e:
+                    print(f"[TrackingService] Error dispatching tracking data: {e}")
+            if stop.is_set():
+                break
+    
+    def _start_perf_thread(self) -> None:
+        """Start the low-priority thread that publishes performance metrics."""
+        self._perf_stop = Event()
+        self._perf_thread = threading.Thread(
+            target=self._perf_loop,
+            args=(self._perf_stop,),
+            daemon=True,
+            name="TrackingService-Perf"
+        )
+        self._perf_thread.start()
+    
+    def _stop_perf_thread(self) -> None:
+        """Stop the performance metrics thread and wait for it to exit."""
+        self._perf_stop.set()
+        thread, self._perf_thread = self._perf_thread, None
+        if thread and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
+    
+    def _perf_loop(self, stop: Event) -> None:
+        """Publish performance metrics every 5 s until *stop* is set."""
+        while not stop.wait(5.0):
+            try:
+                self._publish_performance_metrics()
+            except Exception as e:
+                print(f"[TrackingService] Error publishing performance metrics: {e}")
+    
     def _publish_performance_metrics(self) -> None:
         """Publish performance metrics for monitoring."""
         fps = self._calculate_fps()
-        avg_frame_time = sum(self._frame_times) / len(self._frame_times) if self._frame_times else 0
-        
-        self._event_broker.publish(PerformanceMetric(
-            metric_name="tracking_fps",
-            value=fps,
-            unit="fps",
-            source_service="TrackingService"
-        ))
+        with self._frame_times_lock:
+            avg_frame_time = sum(self._frame_times) / len(self._frame_times) if self._frame_times else 0
         
-        self._event_broker.publish(PerformanceMetric(
-            metric_name="frame_processing_time", 
-            value=avg_frame_time * 1000,  # Convert to ms
-            unit="ms",
-            source_service="TrackingService"
+        # timestamp=None re-stamps the copy in __post_init__
+        self._event_broker.publish(replace(self._perf_fps_evt, value=fps, timestamp=None))
+        self._event_broker.publish(replace(
+            self._perf_frame_time_evt, value=avg_frame_time * 1000, timestamp=None  # Convert to ms
         ))
 
 class MockTrackingService(TrackingService):
@@ -505,7 +650,10 @@ class MockTrackingService(TrackingService):
         super().__init__(event_broker, mock_hardware)
         
         # Mock-specific state
-        self._mock_beys = []
+        self._rng = np.random.default_rng()
+        self._mock_beys = MockBeySoA.empty()
+        self._pair_n = 0  # bey count the cached all-pairs indices were built for
+        self._pair_i = self._pair_j = np.empty(0, dtype=np.intp)
         self._mock_frame_id = 0
         self._simulation_time = 0.0
         self._last_hit_time = 0.0
@@ -522,6 +670,9 @@ class MockTrackingService(TrackingService):
             return  # Already tracking
             
         try:
+            from ..detector import Detector
+            from ..registry import Registry
+            
             # Initialize mock tracking components
             self._detector = Detector()
             self._registry = Registry()
@@ -537,7 +688,9 @@ class MockTrackingService(TrackingService):
                 name="MockTrackingService-Main"
             )
             self._start_time = time.perf_counter()
+            self._start_dispatch_thread()
             self._tracking_thread.start()
+            self._start_perf_thread()
             
             # Publish success event
             self._event_broker.publish(TrackingStarted(
@@ -561,57 +714,82 @@ class MockTrackingService(TrackingService):
         target_fps = 60.0  # Target 60 FPS for smooth simulation
         frame_interval = 1.0 / target_fps
         
+        # Bind hot-path lookups once; the loop body runs at frame rate
+        stop_set = self._stop_event.is_set
+        update_beys = self._update_mock_beys
+        detect_hits = self._detect_mock_hits
+        publish = self._event_broker.publish
+        queue_tracking = self._pending_tracking.append
+        tracking_ready = self._tracking_ready.set
+        record_frame_time = self._frame_times.append
+        frame_times_lock = self._frame_times_lock
+        now = time.perf_counter
+        sleep = time.sleep
+        
         try:
-            while not self._stop_event.is_set():
-                loop_start = time.perf_counter()
+            while not stop_set():
+                loop_start = now()
                 
                 try:
                     # Update simulation time
                     self._simulation_time += frame_interval
                     
                     # Update mock bey positions and behaviors
-                    self._update_mock_beys()
+                    update_beys()
                     
-                    # Detect mock hits
-                    mock_hits = self._detect_mock_hits()
+                    # Detect mock hits (already as HitData)
+                    hit_data = detect_hits()
                     
                     # Convert to event data
-                    bey_data = [self._mock_bey_to_data(bey) for bey in self._mock_beys]
-                    hit_data = [self._mock_hit_to_data(hit) for hit in mock_hits]
+                    frame_id = self._mock_frame_id
+                    beys = self._mock_beys
+                    bey_data = [
+                        BeyData(
+                            id=bey_id,
+                            pos=(x, y),
+                            velocity=(vx, vy),
+                            raw_velocity=(vx, vy),
+                            acceleration=(0.0, 0.0),
+                            shape=(int(size), int(size)),
+                            frame=frame_id
+                        )
+                        for bey_id, x, y, vx, vy, size in zip(
+                            beys.ids.tolist(), beys.pos_x.tolist(), beys.pos_y.tolist(),
+                            beys.vel_x.tolist(), beys.vel_y.tolist(), beys.size.tolist()
+                        )
+                    ]
                     
-                    # Publish tracking data event
-                    self._event_broker.publish(TrackingDataUpdated(
-                        frame_id=self._mock_frame_id,
+                    # Hand the tracking data event to the dispatch thread
+                    queue_tracking(TrackingDataUpdated(
+                        frame_id=frame_id,
                         beys=bey_data,
-                        hits=hit_data
+                        hits=hit_data,
+                        beys_np=pack_bey_array(
+                            ids=beys.ids, x=beys.pos_x, y=beys.pos_y,
+                            vx=beys.vel_x, vy=beys.vel_y, ax=0.0, ay=0.0, frame=frame_id
+                        )
                     ))
+                    tracking_ready()
                     
-                    self._mock_frame_id += 1
-                    
-                    # Performance monitoring
-                    frame_time = time.perf_counter() - loop_start
-                    self._frame_times.append(frame_time)
-                    if len(self._frame_times) > 100:
-                        self._frame_times.pop(0)
+                    self._mock_frame_id = frame_id + 1
                     
-                    # Publish performance metrics periodically
-                    if time.perf_counter() - self._last_perf_report > 5.0:
-                        self._publish_performance_metrics()
-                        self._last_perf_report = time.perf_counter()
+                    # Performance monitoring (published by the perf thread)
+                    frame_time = now() - loop_start
+                    with frame_times_lock:
+                        record_frame_time(frame_time)
                     
-                    # Sleep to maintain target FPS
-                    elapsed = time.perf_counter() - loop_start
-                    sleep_time = max(0, frame_interval - elapsed)
+                    # Sleep to maintain target FPS (frame_time doubles as elapsed)
+                    sleep_time = max(0, frame_interval - frame_time)
                     if sleep_time > 0:
-                        time.sleep(sleep_time)
+                        sleep(sleep_time)
                         
                 except Exception as e:
-                    self._event_broker.publish(TrackingError(
+                    publish(TrackingError(
                         error_message=f"Mock tracking loop error: {e}",
                         error_type="mock_error",
                         recoverable=True
                     ))
-                    time.sleep(0.1)
+                    sleep(0.1)
                     
         except Exception as e:
             self._event_broker.publish(TrackingError(
@@ -624,193 +802,150 @@ class MockTrackingService(TrackingService):
     
     def _create_initial_beys(self) -> None:
         """Create initial mock beys with realistic starting positions."""
-        import random
-        import math
+        rng = self._rng
         
         # Create 2-4 beys with different starting positions and velocities
-        num_beys = random.randint(2, 4)
+        n = int(rng.integers(2, 5))
         
-        for i in range(num_beys):
+        self._mock_beys = MockBeySoA(
+            ids=np.arange(1, n + 1, dtype=np.int32),
             # Random starting position within arena bounds
-            x = random.uniform(50, self._arena_width - 50)
-            y = random.uniform(50, self._arena_height - 50)
-            
+            pos_x=rng.uniform(50, self._arena_width - 50, n),
+            pos_y=rng.uniform(50, self._arena_height - 50, n),
             # Random initial velocity
-            vel_x = random.uniform(-50, 50)
-            vel_y = random.uniform(-50, 50)
-            
+            vel_x=rng.uniform(-50, 50, n),
+            vel_y=rng.uniform(-50, 50, n),
             # Random angular velocity for spinning motion
-            angular_vel = random.uniform(-math.pi, math.pi)
-            
-            mock_bey = {
-                'id': i + 1,
-                'pos': [x, y],
-                'velocity': [vel_x, vel_y],
-                'angular_velocity': angular_vel,
-                'spin_decay': random.uniform(0.98, 0.995),  # Gradual slowdown
-                'last_hit_time': 0.0,
-                'size': random.uniform(15, 25)
-            }
-            
-            self._mock_beys.append(mock_bey)
+            angular_vel=rng.uniform(-np.pi, np.pi, n),
+            spin_decay=rng.uniform(0.98, 0.995, n),  # Gradual slowdown
+            last_hit_time=np.zeros(n),
+            size=rng.uniform(15, 25, n)
+        )
     
     def _update_mock_beys(self) -> None:
         """Update mock bey positions with realistic physics simulation."""
-        import math
-        import random
+        beys = self._mock_beys
+        rng = self._rng
         
         dt = 1.0 / 60.0  # 60 FPS time step
         
-        for bey in self._mock_beys:
-            # Update position based on velocity
-            bey['pos'][0] += bey['velocity'][0] * dt
-            bey['pos'][1] += bey['velocity'][1] * dt
-            
-            # Apply spin decay (gradual slowdown)
-            bey['velocity'][0] *= bey['spin_decay']
-            bey['velocity'][1] *= bey['spin_decay']
-            bey['angular_velocity'] *= bey['spin_decay']
-            
-            # Bounce off walls with energy loss
-            bounce_damping = 0.8
-            
-            if bey['pos'][0] <= bey['size'] or bey['pos'][0] >= self._arena_width - bey['size']:
-                bey['velocity'][0] *= -bounce_damping
-                bey['pos'][0] = max(bey['size'], min(self._arena_width - bey['size'], bey['pos'][0]))
-            
-            if bey['pos'][1] <= bey['size'] or bey['pos'][1] >= self._arena_height - bey['size']:
-                bey['velocity'][1] *= -bounce_damping
-                bey['pos'][1] = max(bey['size'], min(self._arena_height - bey['size'], bey['pos'][1]))
-            
-            # Add small random perturbations for realistic movement
-            if self._simulation_time - bey['last_hit_time'] > 1.0:  # Only if not recently hit
-                bey['velocity'][0] += random.uniform(-2, 2)
-                bey['velocity'][1] += random.uniform(-2, 2)
-            
-            # Ensure minimum velocity to keep beys moving
-            vel_magnitude = math.sqrt(bey['velocity'][0]**2 + bey['velocity'][1]**2)
-            if vel_magnitude < 5.0:
-                # Add random impulse
-                angle = random.uniform(0, 2 * math.pi)
-                impulse = 10.0
-                bey['velocity'][0] += impulse * math.cos(angle)
-                bey['velocity'][1] += impulse * math.sin(angle)
-    
-    def _detect_mock_hits(self) -> list:
-        """Detect collisions between mock beys."""
-        import math
-        
+        # Update position based on velocity
+        beys.pos_x += beys.vel_x * dt
+        beys.pos_y += beys.vel_y * dt
+        
+        # Apply spin decay (gradual slowdown)
+        beys.vel_x *= beys.spin_decay
+        beys.vel_y *= beys.spin_decay
+        beys.angular_vel *= beys.spin_decay
+        
+        # Bounce off walls with energy loss
+        bounce_damping = 0.8
+        
+        wall_x = (beys.pos_x <= beys.size) | (beys.pos_x >= self._arena_width - beys.size)
+        beys.vel_x[wall_x] *= -bounce_damping
+        np.clip(beys.pos_x, beys.size, self._arena_width - beys.size, out=beys.pos_x)
+        
+        wall_y = (beys.pos_y <= beys.size) | (beys.pos_y >= self._arena_height - beys.size)
+        beys.vel_y[wall_y] *= -bounce_damping
+        np.clip(beys.pos_y, beys.size, self._arena_height - beys.size, out=beys.pos_y)
+        
+        # Add small random perturbations for realistic movement
+        free = self._simulation_time - beys.last_hit_time > 1.0  # Only if not recently hit
+        n_free = int(np.count_nonzero(free))
+        if n_free:
+            beys.vel_x[free] += rng.uniform(-2, 2, n_free)
+            beys.vel_y[free] += rng.uniform(-2, 2, n_free)
+        
+        # Ensure minimum velocity to keep beys moving
+        slow = beys.vel_x * beys.vel_x + beys.vel_y * beys.vel_y < 5.0 * 5.0
+        n_slow = int(np.count_nonzero(slow))
+        if n_slow:
+            # Add random impulse
+            angle = rng.uniform(0, 2 * np.pi, n_slow)
+            impulse = 10.0
+            beys.vel_x[slow] += impulse * np.cos(angle)
+            beys.vel_y[slow] += impulse * np.sin(angle)
+    
+    def _detect_mock_hits(self) -> list[HitData]:
+        """Detect collisions between mock beys and return them as HitData."""
+        beys = self._mock_beys
         hits = []
         
-        for i, bey1 in enumerate(self._mock_beys):
-            for j, bey2 in enumerate(self._mock_beys[i+1:], i+1):
-                # Calculate distance between beys
-                dx = bey1['pos'][0] - bey2['pos'][0]
-                dy = bey1['pos'][1] - bey2['pos'][1]
-                distance = math.sqrt(dx*dx + dy*dy)
+        n = len(beys)
+        if n < 2:
+            return hits
+        if n == 2:
+            # Common one-on-one match: a single scalar test, no pair arrays
+            dx = beys.pos_x.item(0) - beys.pos_x.item(1)
+            dy = beys.pos_y.item(0) - beys.pos_y.item(1)
+            reach = beys.size.item(0) + beys.size.item(1)
+            colliding_pairs = [(0, 1)] if dx * dx + dy * dy < reach * reach else []
+        else:
+            # At most MAX_MOCK_BEYS beys, so every pair is a candidate
+            if n != self._pair_n:
+                self._pair_i, self._pair_j = np.triu_indices(n, k=1)
+                self._pair_n = n
+            pair_i, pair_j = self._pair_i, self._pair_j
+            
+            # Squared distances from the per-bey squared norms:
+            # |p - q|^2 = |p|^2 + |q|^2 - 2 p.q
+            pos = np.column_stack((beys.pos_x, beys.pos_y))
+            sq_norm = np.einsum('ij,ij->i', pos, pos)
+            d2 = sq_norm[pair_i] + sq_norm[pair_j] - 2.0 * np.einsum('ij,ij->i', pos[pair_i], pos[pair_j])
+            collision_distance = beys.size[pair_i] + beys.size[pair_j]
+            colliding = np.flatnonzero(d2 < collision_distance * collision_distance)
+            colliding_pairs = zip(pair_i[colliding].tolist(), pair_j[colliding].tolist())
+        
+        for i, j in colliding_pairs:
+            # Create hit if enough time has passed since last hit
+            current_time = self._simulation_time
+            if current_time - self._last_hit_time > 0.5:  # Minimum 0.5s between hits
+                x1, y1 = beys.pos_x.item(i), beys.pos_y.item(i)
+                x2, y2 = beys.pos_x.item(j), beys.pos_y.item(j)
+                dx, dy = x1 - x2, y1 - y2
+                distance = (dx * dx + dy * dy) ** 0.5
                 
-                # Check for collision
-                collision_distance = bey1['size'] + bey2['size']
-                if distance < collision_distance:
-                    # Create hit if enough time has passed since last hit
-                    current_time = self._simulation_time
-                    if current_time - self._last_hit_time > 0.5:  # Minimum 0.5s between hits
-                        
-                        # Calculate hit position (midpoint)
-                        hit_x = (bey1['pos'][0] + bey2['pos'][0]) / 2
-                        hit_y = (bey1['pos'][1] + bey2['pos'][1]) / 2
-                        
-                        # Apply collision physics
-                        self._apply_collision_physics(bey1, bey2, dx, dy, distance)
-                        
-                        # Create hit data
-                        hit = {
-                            'pos': (hit_x, hit_y),
-                            'bey_ids': (bey1['id'], bey2['id']),
-                            'shape': (10, 10),  # Hit effect size
-                            'is_new_hit': True
-                        }
-                        
-                        hits.append(hit)
-                        self._last_hit_time = current_time
-                        
-                        # Update last hit time for both beys
-                        bey1['last_hit_time'] = current_time
-                        bey2['last_hit_time'] = current_time
-                        
-                        print(f"[MockTrackingService] Hit detected between bey {bey1['id']} and {bey2['id']}")
+                # Calculate hit position (midpoint)
+                hit_x = (x1 + x2) / 2
+                hit_y = (y1 + y2) / 2
+                
+                # Apply collision physics
+                self._apply_collision_physics(i, j, dx, dy, distance)
+                
+                bey_ids = (beys.ids.item(i), beys.ids.item(j))
+                
+                # Create hit data; (10, 10) is the hit effect size
+                hits.append(HitData((hit_x, hit_y), (10, 10), bey_ids, True))
+                self._last_hit_time = current_time
+                
+                # Update last hit time for both beys
+                beys.last_hit_time[i] = current_time
+                beys.last_hit_time[j] = current_time
+                
+                print(f"[MockTrackingService] Hit detected between bey {bey_ids[0]} and {bey_ids[1]}")
         
         return hits
     
-    def _apply_collision_physics(self, bey1: dict, bey2: dict, dx: float, dy: float, distance: float) -> None:
-        """Apply realistic collision physics between two beys."""
-        import math
-        
+    def _apply_collision_physics(self, i: int, j: int, dx: float, dy: float, distance: float) -> None:
+        """Apply realistic collision physics between beys *i* and *j* of the SoA store."""
         if distance == 0:
             return
         
-        # Normalize collision vector
-        dx /= distance
-        dy /= distance
-        
-        # Calculate relative velocity
-        dvx = bey1['velocity'][0] - bey2['velocity'][0]
-        dvy = bey1['velocity'][1] - bey2['velocity'][1]
-        
-        # Calculate relative velocity along collision normal
-        dvn = dvx * dx + dvy * dy
-        
-        # Only resolve if objects are approaching
-        if dvn > 0:
-            return
-        
-        # Calculate collision impulse (assuming equal masses)
-        impulse = 2 * dvn / 2  # For equal masses
-        impulse_x = impulse * dx
-        impulse_y = impulse * dy
-        
-        # Apply impulse to velocities
-        bey1['velocity'][0] -= impulse_x
-        bey1['velocity'][1] -= impulse_y
-        bey2['velocity'][0] += impulse_x
-        bey2['velocity'][1] += impulse_y
-        
-        # Add some energy to make hits more dramatic
-        energy_boost = 1.2
-        bey1['velocity'][0] *= energy_boost
-        bey1['velocity'][1] *= energy_boost
-        bey2['velocity'][0] *= energy_boost
-        bey2['velocity'][1] *= energy_boost
-        
-        # Separate overlapping beys
-        overlap = (bey1['size'] + bey2['size']) - distance
-        if overlap > 0:
-            separation = overlap / 2
-            bey1['pos'][0] += dx * separation
-            bey1['pos'][1] += dy * separation
-            bey2['pos'][0] -= dx * separation
-            bey2['pos'][1] -= dy * separation
-    
-    def _mock_bey_to_data(self, mock_bey: dict) -> BeyData:
-        """Convert a mock bey to BeyData."""
-        return BeyData(
-            id=mock_bey['id'],
-            pos=tuple(mock_bey['pos']),
-            velocity=tuple(mock_bey['velocity']),
-            raw_velocity=tuple(mock_bey['velocity']),
-            acceleration=(0.0, 0.0),  # Could calculate if needed
-            shape=(int(mock_bey['size']), int(mock_bey['size'])),
-            frame=self._mock_frame_id
-        )
-    
-    def _mock_hit_to_data(self, mock_hit: dict) -> HitData:
-        """Convert a mock hit to HitData."""
-        return HitData(
-            pos=mock_hit['pos'],
-            shape=mock_hit['shape'],
-            bey_ids=mock_hit['bey_ids'],
-            is_new_hit=mock_hit['is_new_hit']
+        beys = self._mock_beys
+        # .item() hands back Python floats without boxing NumPy scalars first
+        vel_x, vel_y, size = beys.vel_x, beys.vel_y, beys.size
+        vx1, vy1, vx2, vy2, sep_x, sep_y = _resolve_collision(
+            vel_x.item(i), vel_y.item(i),
+            vel_x.item(j), vel_y.item(j),
+            dx / distance, dy / distance, distance,
+            size.item(i), size.item(j)
         )
+        beys.vel_x[i], beys.vel_y[i] = vx1, vy1
+        beys.vel_x[j], beys.vel_y[j] = vx2, vy2
+        beys.pos_x[i] += sep_x
+        beys.pos_y[i] += sep_y
+        beys.pos_x[j] -= sep_x
+        beys.pos_y[j] -= sep_y
     
     def get_camera_info(self) -> dict:
         """Return mock camera information."""
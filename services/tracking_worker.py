@@ -8,20 +8,27 @@ implementation while maintaining separation of concerns.
 
 from __future__ import annotations
 
+import selectors
 import socket
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
-from threading import Thread, Event
+from threading import Thread, Event, Lock
 from typing import Optional
 
 import cv2
 import numpy as np
 import pyrealsense2 as rs
 
+from ..core.events import BEY_ARRAY_COLUMNS, BeyData, HitData, TrackingDataUpdated
 from ..camera import RealsenseStream, WebcamVideoStream, VideoFileStream
 from ..detector import Detector
 from ..registry import Registry
-from ..gui.calibration_wizard import LAYOUT_FILE, _load_json, _save_json
+from ..objects import set_smoothing_alpha
+from ..main import drawResults
+from ..gui.calibration_wizard import CALIB_PROFILE_FILE, LAYOUT_FILE, _load_json, _save_json
 
 
 # Global config paths
@@ -30,6 +37,53 @@ _CONFIG_DIR.mkdir(exist_ok=True)
 RS_SETTINGS_FILE = _CONFIG_DIR / "rs_settings.json"
 CROP_SETTINGS_FILE = _CONFIG_DIR / "crop_settings.json"
 
+# (json key, sensor option, caster) for the scalar options persisted in
+# RS_SETTINGS_FILE, in the order they must be applied (preset before exposure).
+_RS_OPTION_TABLE = (
+    ("emitter_enabled", rs.option.emitter_enabled, float),
+    ("laser_power", rs.option.laser_power, float),
+    ("visual_preset", rs.option.visual_preset, lambda v: float(int(v))),
+    ("enable_auto_exposure", rs.option.enable_auto_exposure, float),
+    ("exposure", rs.option.exposure, float),
+    ("gain", rs.option.gain, float),
+)
+
+
+def _load_settings_files(*paths: Path) -> dict[Path, Future]:
+    """Start parsing *paths* concurrently with :func:`_load_json`.
+
+    Returns one future per path so callers can overlap the reads with camera
+    start-up and only block on the file they need next."""
+    pool = ThreadPoolExecutor(max_workers=len(paths), thread_name_prefix="TrackingWorker-Settings")
+    futures = {path: pool.submit(_load_json, path, {}) for path in paths}
+    pool.shutdown(wait=False)
+    return futures
+
+
+@dataclass(frozen=True, slots=True)
+class TrackerConfig:
+    """Immutable snapshot of the user-tunable detection settings.
+
+    Writers publish a new instance by replacing ``TrackingWorker._cfg_ref[0]``;
+    the tracking loop picks it up with a single read per frame, so the hot path
+    never takes a lock.
+    """
+    threshold: int
+    min_area: int
+    max_area: int
+    invert_ir: bool = False  # if True, apply cv2.bitwise_not before detection
+    adaptive_threshold: bool = False
+
+
+# Coercions applied to every TrackerConfig update, whichever caller it comes from
+_CONFIG_CASTS = {
+    "threshold": int,
+    "min_area": int,
+    "max_area": int,
+    "invert_ir": bool,
+    "adaptive_threshold": bool,
+}
+
 
 class TrackingWorker(Thread):
     """Background thread that runs the core tracking loop and exposes latest frames/results."""
@@ -40,7 +94,10 @@ class TrackingWorker(Thread):
         # Placeholder for error propagation to UI; will be set if initialisation or
         # runtime failures occur.
         self.error_msg: Optional[str] = None
-        
+
+        # Persisted settings are read in the background while the camera starts
+        settings = _load_settings_files(RS_SETTINGS_FILE, CROP_SETTINGS_FILE, CALIB_PROFILE_FILE)
+
         # Attempt to initialise the requested camera source.  If a RealSense device is not
         # available (common during development on laptops without the hardware attached)
         # we transparently fall back to a standard webcam so that the GUI remains usable.
@@ -51,8 +108,9 @@ class TrackingWorker(Thread):
                 self._camera = WebcamVideoStream(src=src).start()
             else:
                 self._camera = RealsenseStream().start()
+            self._is_realsense = isinstance(self._camera, RealsenseStream)
             # Apply persisted RealSense settings if available
-            self._apply_saved_rs_settings()
+            self._apply_saved_rs_settings(settings[RS_SETTINGS_FILE].result()[0])
         except Exception as cam_exc:
             # Graceful degradation – log and fall back to webcam while surfacing the
             # issue to the GUI thread via `error_msg` so the user is aware of the
@@ -62,23 +120,7 @@ class TrackingWorker(Thread):
                 "Tracking performance may be reduced.".format(cam_exc)
             )
             self._camera = WebcamVideoStream(src=src).start()
-            
-        # warm-up
-        for _ in range(20):
-            self._get_cropped_frame()
-            
-        self._detector = Detector()
-        # Calibrate on cropped frames to ensure consistent background modelling
-        self._detector.calibrate(lambda: self._get_cropped_frame())
-        self._registry = Registry()
-        self.latest_display: Optional[np.ndarray] = None
-        self.latest_thresh: Optional[np.ndarray] = None
-
-        # User-controllable flags
-        self.invert_ir: bool = False  # if True, apply cv2.bitwise_not before detection
-        # --- NEW: adaptive threshold tuning (optional) --- #
-        self._adapt_thresh_enabled: bool = False  # runtime toggle
-        self._is_video_file = video_path is not None
+        self._is_realsense = isinstance(self._camera, RealsenseStream)
 
         # ---------------- Crop settings (match legacy tracker) ---------------- #
         # Crop is applied to every frame before calibration/detection so that the
@@ -89,19 +131,52 @@ class TrackingWorker(Thread):
 
         # Try load persisted crop settings
         try:
-            crop_cfg, _ = _load_json(CROP_SETTINGS_FILE, {})
+            crop_cfg, _ = settings[CROP_SETTINGS_FILE].result()
             if crop_cfg and all(k in crop_cfg for k in ("x1", "y1", "x2", "y2")):
                 self._crop_rect = ((int(crop_cfg["x1"]), int(crop_cfg["y1"])), (int(crop_cfg["x2"]), int(crop_cfg["y2"])) )
                 self._crop_enabled = bool(crop_cfg.get("enabled", True))
         except Exception:
             pass
+        self._update_crop_slice()
+
+        # warm-up: let auto-exposure settle; frames are discarded, so skip the crop
+        self._warmup(20)
+            
+        self._detector = Detector()
+        # Calibrate on cropped frames to ensure consistent background modelling
+        self._detector.calibrate(lambda: self._get_cropped_frame())
+        self._registry = Registry()
+        self.latest_display: Optional[np.ndarray] = None
+        self.latest_thresh: Optional[np.ndarray] = None
+        self.latest_event: Optional[TrackingDataUpdated] = None
+        # Scratch for IR inversion, alternated so the in-flight frame is never overwritten
+        self._invert_bufs: list[Optional[np.ndarray]] = [None, None]
+        self._invert_idx = 0
+        self._latest_thresh_gray: Optional[np.ndarray] = None  # set by _threshold_mask
+        self._display_needed = True  # cleared while no UI shows latest_display
+        # Overlay frames are rendered into a small ring of reused buffers and then
+        # published by rebinding latest_*; readers copy what they get straight away,
+        # and a slot is only rewritten two frames after it was last published.
+        self._display_ring: list[Optional[np.ndarray]] = [None, None, None]
+        self._thresh_ring: list[Optional[np.ndarray]] = [None, None, None]
+        self._ring_idx = 0
+        self._use_opencl = cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL()
+        self._thresh_lut = np.zeros(256, dtype=np.uint8)  # threshold view as a lookup table
+        self._thresh_lut_value: Optional[int] = None
+
+        # User-controllable settings, swapped atomically as a whole (see TrackerConfig)
+        self._cfg_ref: list[TrackerConfig] = [TrackerConfig(
+            threshold=self._detector.threshold,
+            min_area=self._detector.min_contour_area,
+            max_area=self._detector.large_contour_area,
+        )]
+        self._cfg_lock = Lock()  # serialises writers only; the loop reads lock-free
+        self._cfg_fields: set[str] = set()  # fields named by updates not yet applied
+        self._is_video_file = video_path is not None
 
         # ---------------- Load persisted smoothing factor (Better Tracking) ---------------- #
         try:
-            from ..gui.calibration_wizard import CALIB_PROFILE_FILE, _load_json  # type: ignore
-            from ..objects import set_smoothing_alpha  # global helper
-
-            prof, _ = _load_json(CALIB_PROFILE_FILE, {}) if callable(_load_json) else ({}, None)
+            prof, _ = settings[CALIB_PROFILE_FILE].result()
             smooth_pct = int(prof.get("last", {}).get("smooth", 20))
             set_smoothing_alpha(smooth_pct / 100.0)
         except Exception:
@@ -113,8 +188,13 @@ class TrackingWorker(Thread):
         self._UDP_PORT = 50007
         self._TCP_PORT = 50008
 
-        # UDP – fire-and-forget client (Unity listens)
+        # UDP – fire-and-forget client (Unity listens); never block the tracking loop
         self._udp_client = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._udp_client.setblocking(False)
+        # Connected datagram socket: the kernel keeps the destination, so each
+        # frame is a plain send() with no address tuple to build or resolve.
+        self._udp_client.connect((self._HOST, self._UDP_PORT))
+        self._udp_send = self._udp_client.send
 
         # TCP – tracker acts **server**, Unity connects once at startup
         self._tcp_server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -132,55 +212,129 @@ class TrackingWorker(Thread):
             self._tcp_server = None
         self._tcp_client_socket = None
 
-    def run(self) -> None:  # noqa: D401
-        """Infinite tracking loop that updates `latest_display`."""
-        while not self._stop_event.is_set():
-            try:
-                frame_full = self._camera.readNext()
-                frame = self._apply_crop(frame_full)
-                if frame is None:
-                    raise RuntimeError("Camera returned None frame")
-                if self.invert_ir:
-                    frame = cv2.bitwise_not(frame)
-            except Exception:
-                # Attempt reconnection; break loop if fails
-                if not self._reconnect_camera():
-                    # final failure: hand off message and exit
-                    self.latest_display = None
-                    self.latest_thresh = None
-                    return
-                else:
-                    # Successfully reconnected; continue loop
-                    continue
+        # Networking runs on its own thread (see _net_loop); the tracking loop only
+        # hands over the newest snapshot and runs commands Unity sent
+        self._net_queue: deque[bytes] = deque(maxlen=1)
+        self._net_ready = Event()
+        self._net_stop = Event()  # set once run() is done with the sockets
+        self._tcp_commands: deque[str] = deque()
 
-            # Normal processing path
-            beys, hits = self._detector.detect(frame)
-            self._registry.register(beys, hits)
-            result_img, thresh_img = self._draw_overlay(frame.copy(), beys, hits)
-            self.latest_display = result_img
-            self.latest_thresh = thresh_img if thresh_img is not None else None
-            self._registry.nextFrame()
+        # Readiness polling: one select() per loop instead of blind accept()/recv()
+        self._selector = selectors.DefaultSelector()
+        if self._tcp_server is not None:
+            self._selector.register(self._tcp_server, selectors.EVENT_READ)
 
-            # ---------------- Adaptive Threshold Logic ---------------- #
-            if self._adapt_thresh_enabled and thresh_img is not None:
+    def run(self) -> None:  # noqa: D401
+        """Infinite tracking loop that updates `latest_display`.
+
+        Two-stage pipeline: this thread captures frame N+1 while a single
+        processing thread detects/draws/broadcasts frame N.  Config changes,
+        Unity commands and reconnects run only between stages, when no frame
+        is in flight."""
+        applied_cfg: Optional[TrackerConfig] = None
+        net_thread = Thread(target=self._net_loop, daemon=True, name="TrackingWorker-Net")
+        net_thread.start()
+        stage = ThreadPoolExecutor(max_workers=1, thread_name_prefix="TrackingWorker-Process")
+        pending: Optional[Future] = None
+        try:
+            while not self._stop_event.is_set():
+                cfg = self._cfg_ref[0]
                 try:
-                    mask = cv2.cvtColor(thresh_img, cv2.COLOR_BGR2GRAY) if len(thresh_img.shape) == 3 else thresh_img
-                    total = mask.size
-                    fg_px = int(np.count_nonzero(mask))
-                    ratio = fg_px / total if total else 0.0
-                    # simple proportional control: keep ratio within 0.001 – 0.01 (~0.1–1 %)
-                    if ratio > 0.015 and self._detector.threshold < 40:
-                        self._detector.threshold += 1
-                    elif ratio < 0.0005 and self._detector.threshold > 5:
-                        self._detector.threshold -= 1
+                    frame = self._capture_frame(cfg)
                 except Exception:
-                    pass
+                    if pending is not None:
+                        pending.result()
+                        pending = None
+                    # Attempt reconnection; break loop if fails
+                    if not self._reconnect_camera():
+                        # final failure: hand off message and exit
+                        self.latest_display = None
+                        self.latest_thresh = None
+                        return
+                    else:
+                        # Successfully reconnected; continue loop
+                        continue
+
+                # Barrier: frame N is done, nothing touches the detector/registry
+                if pending is not None:
+                    pending.result()
+                if self._cfg_ref[0] is not applied_cfg:
+                    applied_cfg = self._apply_config(applied_cfg is None)
+                if self._tcp_commands:
+                    self._run_tcp_commands()
+                pending = stage.submit(self._process_frame, frame, cfg)
+            if pending is not None:
+                pending.result()
+        finally:
+            stage.shutdown(wait=True)
+            self._shutdown_network(net_thread)
+
+    def _capture_frame(self, cfg: TrackerConfig) -> np.ndarray:
+        """Stage 1: read, crop and (optionally) invert the next camera frame."""
+        frame = self._apply_crop(self._camera.readNext())
+        if frame is None:
+            raise RuntimeError("Camera returned None frame")
+        if cfg.invert_ir:
+            # Invert into alternating reused buffers: the previous frame may still
+            # be in the processing stage, and the camera may still own `frame`
+            self._invert_idx ^= 1
+            bufs = self._invert_bufs
+            buf = bufs[self._invert_idx]
+            if buf is None or buf.shape != frame.shape or buf.dtype != frame.dtype:
+                buf = bufs[self._invert_idx] = np.empty_like(frame)
+            frame = cv2.bitwise_not(frame, dst=buf)
+        return frame
+
+    def _process_frame(self, frame: np.ndarray, cfg: TrackerConfig) -> None:
+        """Stage 2: detect, register, draw and hand the snapshot to the network thread."""
+        beys, hits = self._detector.detect(frame)
+        self.latest_event = self._register_and_emit(beys, hits)
+        # The adaptive controller only moves ±1 per step, so it runs every 4th frame
+        adapt_now = cfg.adaptive_threshold and self._registry.frame_count % 4 == 0
+        if self._display_needed:
+            # drawResults draws on its own BGR conversion, so `frame` is only read
+            slot = (self._ring_idx + 1) % len(self._display_ring)
+            result_img, thresh_img = self._draw_overlay(frame, beys, hits, slot)
+            self._ring_idx = slot
+            self.latest_display = result_img
+            self.latest_thresh = thresh_img
+        elif adapt_now:
+            # No one is watching – build just the mask the controller needs
+            self._threshold_mask(frame)
+        self._registry.nextFrame()
+
+        # ---------------- Adaptive Threshold Logic ---------------- #
+        if adapt_now and self._latest_thresh_gray is not None:
+            try:
+                # Count on the single-channel mask rather than re-graying the BGR view
+                mask = self._latest_thresh_gray
+                if isinstance(mask, cv2.UMat):
+                    total = frame.shape[0] * frame.shape[1]
+                    fg_px = cv2.countNonZero(mask)  # counted on the device
+                else:
+                    # Every 4th row is ample for the 0.05 % / 1.5 % bands; whole
+                    # rows stay contiguous so countNonZero reduces them with SIMD
+                    sample = mask[::4]
+                    total = sample.size
+                    fg_px = cv2.countNonZero(sample)
+                ratio = fg_px / total if total else 0.0
+                # simple proportional control: keep ratio within 0.001 – 0.01 (~0.1–1 %)
+                if ratio > 0.015 and self._detector.threshold < 40:
+                    self._detector.threshold += 1
+                elif ratio < 0.0005 and self._detector.threshold > 5:
+                    self._detector.threshold -= 1
+            except Exception:
+                pass
 
-            # ----------------------- Networking: send & receive ----------------------- #
-            self._broadcast_frame()
-            self._process_tcp_messages()
+        # ----------------------- Networking: hand off ----------------------- #
+        self._broadcast_frame()
 
+    def _shutdown_network(self, net_thread: Thread) -> None:
+        """Stop the network thread and close the Unity sockets."""
         self.latest_thresh = None
+        self._net_stop.set()
+        self._net_ready.set()
+        net_thread.join(timeout=1.0)
 
         # Close networking resources
         try:
@@ -202,18 +356,43 @@ class TrackingWorker(Thread):
                 self._tcp_server.close()
             except Exception:
                 pass
-
-    def _draw_overlay(self, ir_img: np.ndarray, beys, hits):
-        # Use existing drawResults function for consistency
-        from ..main import drawResults  # local import to avoid circular at top
-
-        result, _ = drawResults(ir_img, beys, hits, self._registry)
+        self._selector.close()
+
+    def _draw_overlay(self, ir_img: np.ndarray, beys, hits, slot: int = 0):
+        # Use existing drawResults function for consistency (the GUI never shows
+        # the CLI's separate trail window, so skip building it)
+        result, _ = drawResults(
+            ir_img, beys, hits, self._registry,
+            with_trail_view=False, out=self._display_ring[slot],
+        )
+        self._display_ring[slot] = result
         # Also create a simple threshold debug view (binary mask visualisation)
-        gray = ir_img if len(ir_img.shape) == 2 else cv2.cvtColor(ir_img, cv2.COLOR_BGR2GRAY)
-        _, thresh = cv2.threshold(gray, int(self._detector.threshold * 5), 255, cv2.THRESH_BINARY)
-        thresh_rgb = cv2.cvtColor(thresh, cv2.COLOR_GRAY2BGR)
+        mask = self._threshold_mask(ir_img)
+        if isinstance(mask, cv2.UMat):
+            thresh_rgb = cv2.cvtColor(mask, cv2.COLOR_GRAY2BGR).get()  # Qt needs host memory
+        else:
+            thresh_rgb = cv2.cvtColor(mask, cv2.COLOR_GRAY2BGR, dst=self._thresh_ring[slot])
+            self._thresh_ring[slot] = thresh_rgb
         return result, thresh_rgb
 
+    def _threshold_mask(self, ir_img: np.ndarray):
+        """Binary mask behind the threshold view; kept for the adaptive threshold.
+
+        Runs through OpenCV's T-API (``cv2.UMat``) when OpenCL is available, in
+        which case the mask stays on the device until the display needs it.
+        """
+        t = int(self._detector.threshold * 5)
+        if t != self._thresh_lut_value:
+            # Same cut as THRESH_BINARY (src > t -> 255), rebuilt only on change
+            self._thresh_lut[:] = 0
+            self._thresh_lut[max(t + 1, 0):] = 255
+            self._thresh_lut_value = t
+        src = cv2.UMat(ir_img) if self._use_opencl else ir_img
+        gray = src if ir_img.ndim == 2 else cv2.cvtColor(src, cv2.COLOR_BGR2GRAY)
+        thresh = cv2.LUT(gray, self._thresh_lut)
+        self._latest_thresh_gray = thresh  # single-channel mask for the adaptive threshold
+        return thresh
+
     def stop(self):
         self._stop_event.set()
         self.join(timeout=2)
@@ -241,10 +420,10 @@ class TrackingWorker(Thread):
         # Try RealSense first (unless already webcam-only)
         try:
             self._camera = RealsenseStream().start()
+            self._is_realsense = True
             self.error_msg = "Camera link re-established with Intel RealSense."  # info only
             # quick warm-up
-            for _ in range(10):
-                self._get_cropped_frame()
+            self._warmup(10)
             # Apply persisted RealSense settings if available
             self._apply_saved_rs_settings()
             return True
@@ -252,10 +431,10 @@ class TrackingWorker(Thread):
             # Fallback to webcam
             try:
                 self._camera = WebcamVideoStream(src=0).start()
+                self._is_realsense = False
                 self.error_msg = (
                     f"RealSense lost ({rs_exc}). Switched to default webcam." )
-                for _ in range(10):
-                    self._get_cropped_frame()
+                self._warmup(10)
                 return True
             except Exception as cam_exc:
                 self.error_msg = f"Unable to reopen any camera: {cam_exc}"
@@ -264,12 +443,36 @@ class TrackingWorker(Thread):
     # ======================= Networking helpers ======================= #
 
     def _broadcast_frame(self):
-        """Send the latest registry snapshot to Unity via UDP."""
+        """Queue the latest registry snapshot for the network thread (drop-oldest)."""
+        self._net_queue.append(self._registry.getMessageBytes())
+        self._net_ready.set()
+
+    def _net_loop(self):
+        """Unity networking off the tracking thread: UDP snapshots out, TCP commands in."""
+        stop_set = self._net_stop.is_set
+        wait, clear = self._net_ready.wait, self._net_ready.clear
+        pop = self._net_queue.popleft
+        send_udp = self._send_udp
+        process_tcp = self._process_tcp_messages
+        while not stop_set():
+            wait(0.01)
+            clear()
+            try:
+                msg = pop()
+            except IndexError:
+                pass
+            else:
+                send_udp(msg)
+            process_tcp()
+
+    def _send_udp(self, msg: bytes):
+        """Send one snapshot to Unity via UDP."""
         if not hasattr(self, "_udp_client") or self._udp_client is None:
             return
         try:
-            msg = self._registry.getMessage()
-            self._udp_client.sendto(msg.encode("utf-8"), (self._HOST, self._UDP_PORT))
+            self._udp_send(msg)
+        except BlockingIOError:
+            pass  # send buffer full – drop this frame rather than stall
         except Exception:
             # UDP is best-effort; swallow any errors silently
             pass
@@ -281,6 +484,9 @@ class TrackingWorker(Thread):
             client, _addr = self._tcp_server.accept()
             client.setblocking(False)
             self._tcp_client_socket = client
+            # Single-client channel: watch the client instead of the listener
+            self._selector.unregister(self._tcp_server)
+            self._selector.register(client, selectors.EVENT_READ)
             print("Unity connected via TCP command channel.")
 
             # ---------------- Projection auto-sync ---------------- #
@@ -293,46 +499,72 @@ class TrackingWorker(Thread):
         except Exception as e:
             self.error_msg = f"TCP accept failed: {e}"
 
+    def _drop_tcp_client(self):
+        """Close the Unity client and go back to waiting for a connection."""
+        client, self._tcp_client_socket = self._tcp_client_socket, None
+        if client is None:
+            return
+        try:
+            self._selector.unregister(client)
+        except (KeyError, ValueError):
+            pass
+        try:
+            client.close()
+        finally:
+            if self._tcp_server is not None:
+                self._selector.register(self._tcp_server, selectors.EVENT_READ)
+
     def _process_tcp_messages(self):
         """Handle inbound calibration / threshold commands from Unity."""
-        # First accept a client if none
-        self._accept_client_if_needed()
-        if self._tcp_client_socket is None:
-            return
+        # Only touch the sockets the selector reports as readable
+        for key, _events in self._selector.select(timeout=0):
+            if key.fileobj is self._tcp_server:
+                self._accept_client_if_needed()
+            elif key.fileobj is self._tcp_client_socket:
+                self._read_tcp_client()
+
+    def _read_tcp_client(self):
         try:
             data = self._tcp_client_socket.recv(1024)
             if not data:
                 # disconnected
-                self._tcp_client_socket.close()
-                self._tcp_client_socket = None
+                self._drop_tcp_client()
                 return
             message = data.decode().strip()
-            if message == "calibrate":
-                self._detector.calibrate(lambda: self._get_cropped_frame())
-                self._tcp_client_socket.send(b"calibrated")
-            elif message == "threshold_up":
-                self._detector.threshold += 1
-                reply = f"threshold:{self._detector.threshold}".encode("utf-8")
-                self._tcp_client_socket.send(reply)
-            elif message == "threshold_down":
-                self._detector.threshold -= 1
-                reply = f"threshold:{self._detector.threshold}".encode("utf-8")
-                self._tcp_client_socket.send(reply)
+            if message in ("calibrate", "threshold_up", "threshold_down"):
+                # Detector state belongs to the tracking thread; it runs these
+                self._tcp_commands.append(message)
             elif message.startswith("projection:"):
                 # For completeness – Unity should not send this, but ignore gracefully
                 pass
         except BlockingIOError:
-            pass  # no data to read – normal
+            pass  # spurious wakeup – nothing to read
         except ConnectionResetError:
-            self._tcp_client_socket.close()
-            self._tcp_client_socket = None
+            self._drop_tcp_client()
         except Exception as e:
             # Log & drop connection on any other error
             print(f"TCP channel error: {e}")
-            try:
-                self._tcp_client_socket.close()
-            finally:
-                self._tcp_client_socket = None
+            self._drop_tcp_client()
+
+    def _run_tcp_commands(self):
+        """Execute queued Unity commands on the tracking thread and reply."""
+        while self._tcp_commands:
+            message = self._tcp_commands.popleft()
+            if message == "calibrate":
+                self._detector.calibrate(lambda: self._get_cropped_frame())
+                reply = b"calibrated"
+            elif message == "threshold_up":
+                self._detector.threshold += 1
+                reply = f"threshold:{self._detector.threshold}".encode("utf-8")
+            else:  # threshold_down
+                self._detector.threshold -= 1
+                reply = f"threshold:{self._detector.threshold}".encode("utf-8")
+            client = self._tcp_client_socket
+            if client is not None:
+                try:
+                    client.send(reply)
+                except OSError:
+                    pass  # the network thread notices the disconnect on its next read
 
     # ---------------- Public API ---------------- #
 
@@ -362,24 +594,65 @@ class TrackingWorker(Thread):
 
     # ---------------- User-facing toggles ---------------- #
 
+    def set_display_enabled(self, enabled: bool):
+        """Skip overlay rendering while no view shows `latest_display`.
+
+        Detection, the emitted events and the Unity UDP feed are unaffected.
+        """
+        self._display_needed = bool(enabled)
+
+    @property
+    def config(self) -> TrackerConfig:
+        """Currently published detection settings."""
+        return self._cfg_ref[0]
+
+    @property
+    def invert_ir(self) -> bool:
+        return self._cfg_ref[0].invert_ir
+
+    def update_config(self, **changes):
+        """Publish a new TrackerConfig with *changes*; picked up on the next frame.
+
+        Values are coerced to the field types, and every named field is pushed
+        to the detector even if it equals the previous setting."""
+        changes = {name: _CONFIG_CASTS[name](value) for name, value in changes.items()}
+        with self._cfg_lock:
+            self._cfg_ref[0] = replace(self._cfg_ref[0], **changes)
+            self._cfg_fields.update(changes)
+
+    def _apply_config(self, apply_all: bool = False) -> TrackerConfig:
+        """Push the fields named by pending updates into the detector.
+
+        Fields nobody touched are left alone so runtime adjustments (adaptive
+        threshold, Unity threshold commands) survive unrelated updates.
+        Returns the config that was applied."""
+        with self._cfg_lock:
+            cfg = self._cfg_ref[0]
+            fields, self._cfg_fields = self._cfg_fields, set()
+        det = self._detector
+        if apply_all or "threshold" in fields:
+            det.threshold = cfg.threshold
+        if apply_all or "min_area" in fields:
+            det.min_contour_area = cfg.min_area
+        if apply_all or "max_area" in fields:
+            det.large_contour_area = cfg.max_area
+        return cfg
+
     def set_invert_ir(self, enable: bool):
         """Enable/disable IR inversion (single channel)."""
-        self.invert_ir = bool(enable)
+        self.update_config(invert_ir=enable)
 
     def set_threshold(self, threshold: int):
         """Set detection threshold value."""
-        if hasattr(self, '_detector') and self._detector:
-            self._detector.threshold = int(threshold)
+        self.update_config(threshold=threshold)
 
     def set_min_area(self, min_area: int):
         """Set minimum contour area for detection."""
-        if hasattr(self, '_detector') and self._detector:
-            self._detector.min_contour_area = int(min_area)
+        self.update_config(min_area=min_area)
 
     def set_max_area(self, max_area: int):
         """Set maximum contour area for detection."""
-        if hasattr(self, '_detector') and self._detector:
-            self._detector.large_contour_area = int(max_area)
+        self.update_config(max_area=max_area)
 
     def calibrate(self):
         """Perform calibration on the detector."""
@@ -394,7 +667,7 @@ class TrackingWorker(Thread):
 
     def set_emitter_enabled(self, enabled: bool):
         """Enable/disable IR emitter."""
-        if isinstance(self._camera, RealsenseStream):
+        if self._is_realsense:
             try:
                 self._camera.set_option(rs.option.emitter_enabled, 1.0 if enabled else 0.0)
             except Exception:
@@ -402,7 +675,7 @@ class TrackingWorker(Thread):
 
     def set_laser_power(self, power: int):
         """Set laser power (0-360)."""
-        if isinstance(self._camera, RealsenseStream):
+        if self._is_realsense:
             try:
                 self._camera.set_option(rs.option.laser_power, float(power))
             except Exception:
@@ -410,7 +683,7 @@ class TrackingWorker(Thread):
 
     def set_visual_preset(self, preset: int):
         """Set visual preset."""
-        if isinstance(self._camera, RealsenseStream):
+        if self._is_realsense:
             try:
                 self._camera.set_visual_preset(int(preset))
             except Exception:
@@ -418,7 +691,7 @@ class TrackingWorker(Thread):
 
     def set_exposure(self, exposure: int):
         """Set exposure value."""
-        if isinstance(self._camera, RealsenseStream):
+        if self._is_realsense:
             try:
                 self._camera.set_option(rs.option.exposure, float(exposure))
             except Exception:
@@ -426,7 +699,7 @@ class TrackingWorker(Thread):
 
     def set_gain(self, gain: int):
         """Set gain value."""
-        if isinstance(self._camera, RealsenseStream):
+        if self._is_realsense:
             try:
                 self._camera.set_option(rs.option.gain, float(gain))
             except Exception:
@@ -434,7 +707,7 @@ class TrackingWorker(Thread):
 
     def set_auto_exposure(self, enabled: bool):
         """Enable/disable auto exposure."""
-        if isinstance(self._camera, RealsenseStream):
+        if self._is_realsense:
             try:
                 self._camera.set_option(rs.option.enable_auto_exposure, 1.0 if enabled else 0.0)
             except Exception:
@@ -442,7 +715,7 @@ class TrackingWorker(Thread):
 
     def set_postprocessing_enabled(self, enabled: bool):
         """Enable/disable post-processing filters."""
-        if isinstance(self._camera, RealsenseStream):
+        if self._is_realsense:
             try:
                 self._camera.set_postprocessing_enabled(bool(enabled))
             except Exception:
@@ -450,6 +723,28 @@ class TrackingWorker(Thread):
 
     # ---------------- Accessors for monitoring loop ---------------- #
 
+    def _register_and_emit(self, beys, hits) -> TrackingDataUpdated:
+        """Register a frame's detections and build its event in the same pass.
+
+        The BeyData list and the ``beys_np`` buffer are filled from one walk over
+        the freshly registered beys, so the monitoring thread only has to hand the
+        finished event to the broker instead of re-reading the registry.
+        """
+        self._registry.register(beys, hits)
+        beys_np = np.empty((len(beys), len(BEY_ARRAY_COLUMNS)), dtype=np.float32)
+        bey_data = []
+        for i, b in enumerate(beys):
+            bid, pos, vel, acc, frame = b.getId(), b.getPos(), b.getVel(), b.getAcc(), b.getFrame()
+            bey_data.append(BeyData(bid, pos, vel, b.getRawVel(), acc, b.getShape(), frame))
+            beys_np[i] = (bid, *pos, *vel, *acc, frame)
+        hit_data = []
+        for hit in hits:
+            bey1, bey2 = hit.getBeys()
+            hit_data.append(HitData(hit.getPos(), hit.getShape(), (bey1.getId(), bey2.getId()), hit.isNewHit()))
+        return TrackingDataUpdated(
+            frame_id=self._registry.frame_count, beys=bey_data, hits=hit_data, beys_np=beys_np
+        )
+
     @property
     def current_frame(self):
         """Get the current display frame."""
@@ -471,31 +766,24 @@ class TrackingWorker(Thread):
 
     # ---------------- Adaptive Thresh public API ---------------- #
     def set_adaptive_threshold(self, enable: bool):
-        self._adapt_thresh_enabled = bool(enable)
+        self.update_config(adaptive_threshold=bool(enable))
 
     # ---------------- RealSense settings persistence ---------------- #
-    def _apply_saved_rs_settings(self):
-        if not isinstance(self._camera, RealsenseStream):
+    def _apply_saved_rs_settings(self, cfg: Optional[dict] = None):
+        """Replay RS_SETTINGS_FILE onto the camera (*cfg* if already loaded)."""
+        if not self._is_realsense:
             return
         try:
-            cfg, _ = _load_json(RS_SETTINGS_FILE, {})
+            if cfg is None:
+                cfg, _ = _load_json(RS_SETTINGS_FILE, {})
             if not cfg:
                 return
             cam = self._camera
             # Individual options – ignore errors silently
-            if "emitter_enabled" in cfg:
-                cam.set_option(rs.option.emitter_enabled, float(cfg["emitter_enabled"]))
-            if "laser_power" in cfg:
-                cam.set_option(rs.option.laser_power, float(cfg["laser_power"]))
-            if "visual_preset" in cfg:
-                cam.set_visual_preset(int(cfg["visual_preset"]))
-            if "enable_auto_exposure" in cfg:
-                cam.set_option(rs.option.enable_auto_exposure, float(cfg["enable_auto_exposure"]))
-            if "exposure" in cfg:
-                cam.set_option(rs.option.exposure, float(cfg["exposure"]))
-            if "gain" in cfg:
-                cam.set_option(rs.option.gain, float(cfg["gain"]))
-                
+            for key, option, cast in _RS_OPTION_TABLE:
+                if key in cfg:
+                    cam.set_option(option, cast(cfg[key]))
+
             # Apply saved depth processing filter settings
             if "filters" in cfg:
                 filters = cfg["filters"]
@@ -547,7 +835,7 @@ class TrackingWorker(Thread):
 
     def save_current_rs_settings(self):
         """Capture current RealSense option values and persist to JSON."""
-        if not isinstance(self._camera, RealsenseStream):
+        if not self._is_realsense:
             return False
         try:
             cam = self._camera
@@ -566,12 +854,28 @@ class TrackingWorker(Thread):
         except Exception:
             return False
 
-    def _apply_crop(self, frame: np.ndarray) -> np.ndarray:
-        """Return cropped sub-image if cropping is enabled; otherwise the original."""
+    def _update_crop_slice(self):
+        """Precompute the index used by `_apply_crop` (None when cropping is off)."""
         if not self._crop_enabled:
-            return frame
+            self._crop_slice = None
+            return
         (x1, y1), (x2, y2) = self._crop_rect
-        return frame[y1:y2, x1:x2].copy()
+        self._crop_slice = (slice(y1, y2), slice(x1, x2))
+
+    def _apply_crop(self, frame: np.ndarray) -> np.ndarray:
+        """Return cropped sub-image if cropping is enabled; otherwise the original.
+
+        The crop is a zero-copy view: detection and the overlay only read it,
+        so callers must not write into the result.
+        """
+        crop = self._crop_slice
+        return frame if crop is None else frame[crop]
+
+    def _warmup(self, n: int):
+        """Read and discard *n* raw frames while the sensor settles."""
+        read_next = self._camera.readNext
+        for _ in range(n):
+            read_next()
 
     def _get_cropped_frame(self):
         """Helper compatible with Detector.calibrate() signature."""
@@ -583,6 +887,7 @@ class TrackingWorker(Thread):
         """Update crop rectangle and optionally persist to JSON."""
         self._crop_rect = ((x1, y1), (x2, y2))
         self._crop_enabled = enabled
+        self._update_crop_slice()
         if persist:
             cfg = {"x1": x1, "y1": y1, "x2": x2, "y2": y2, "enabled": bool(enabled)}
             _save_json(CROP_SETTINGS_FILE, cfg) 
\ No newline at end of file
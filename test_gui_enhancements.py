@@ -14,24 +14,164 @@ Usage:
 
 import sys
 import time
+import logging
 import argparse
+import functools
 from pathlib import Path
+from string import Template
 from typing import Dict, Any
 
+logger = logging.getLogger(__name__)
+
 # Add project root to path for imports
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import QTimer
+# Qt and the GUI components are imported inside the tests that use them, so
+# the build system check never pays for loading PySide6
+
+
+@functools.cache
+def _get_app():
+    """Return the process-wide QApplication, creating it on first use."""
+    from PySide6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+# Validation report; the placeholders are filled by plain dict lookups in
+# GUIEnhancementsValidator.generate_validation_report()
+_REPORT_TEMPLATE = Template("""
+# BBAN-Tracker GUI Enhancements Validation Report
+
+## Test Summary
+- **System Status Panel**: $status_panel
+- **Advanced Settings Dialog**: $settings_dialog
+- **Main Window Integration**: $main_window
+- **EDA Integration**: $eda_integration
+- **Build System**: $build_system
+
+## Implementation Status
+
+### ✅ COMPLETED FEATURES:
+
+1. **System Status Dashboard**
+   - Always-visible status panel showing camera, Unity, tracking, and system health
+   - Real-time performance metrics (FPS, events/sec)
+   - Color-coded status indicators with animated feedback
+   - Integrated with main window layout
+
+2. **Advanced Settings Dialog**
+   - Comprehensive configuration interface for power users
+   - Performance optimization controls (FPS, batching, memory limits)
+   - Event system configuration (queue sizes, threading)
+   - Network settings (timeouts, buffer sizes, connection options)
+   - Debug and diagnostics tools
+   - Settings persistence across sessions
+
+3. **Main Window Enhancement**
+   - Integrated system status panel in sidebar
+   - Real-time status updates from EDA events
+   - Improved layout with dedicated status area
+   - Enhanced visual feedback system
+
+4. **EDA Integration**
+   - System status panel receives real-time updates from event broker
+   - Performance metrics flow through EDA architecture
+   - All status changes driven by events (TrackingStarted, ProjectionConnected, etc.)
+   - Seamless integration with existing service architecture
+
+5. **Production Build System**
+   - Comprehensive PyInstaller-based build script
+   - Automatic dependency bundling and configuration
+   - Creates both directory and single-file distributions
+   - Includes default configuration files for deployment
+   - Launcher scripts for easy end-user deployment
+   - Debug and release build modes
+
+### 🚀 DEPLOYMENT READY:
 
-# Import our enhanced components
-from gui.ui_components.system_status_panel import SystemStatusPanel, ConnectionStatus
-from gui.ui_components.advanced_settings_dialog import show_advanced_settings_dialog
-from gui.main_window import MainWindow
-from services.gui_service import GUIService
-from core.event_broker import EventBroker
-from core.events import TrackingStarted, TrackingStopped, ProjectionClientConnected, PerformanceMetric
+The BBAN-Tracker application now includes:
+- Professional system status monitoring
+- Advanced configuration capabilities
+- Production-ready build and deployment system
+- Zero-friction end-user experience
+
+### 📦 BUILD USAGE:
+
+```bash
+# Install build dependencies
+pip install -r requirements.txt
+
+# Create production build
+python build.py --clean
+
+# Create single-file executable
+python build.py --onefile --clean
+
+# Create debug build for troubleshooting
+python build.py --debug --clean
+```
+
+### 🎯 SUCCESS CRITERIA MET:
+
+✅ System Status Panel - Always visible, real-time status indicators
+✅ Advanced Settings Dialog - Power user configuration interface  
+✅ Visual Polish - Professional, consistent UI throughout
+✅ PyInstaller Build System - One-click deployment packaging
+✅ Configuration Management - Multiple deployment profiles
+✅ Production Deployment - Ready for end-user distribution
+
+## Code Quality Assessment (CQP)
+
+### Readability & Standards: 15/15 CQP
+- Consistent PEP8 style throughout
+- Clear, descriptive naming conventions
+- Comprehensive docstrings for all classes and methods
+
+### Maintainability: 20/20 CQP  
+- Modular design with clear separation of concerns
+- System status panel as reusable component
+- Advanced settings with data class configuration
+- Clean EDA integration without tight coupling
+
+### Efficiency & Performance: 12/15 CQP
+- Efficient Qt widget updates with minimal overhead
+- Timer-based status updates to prevent UI blocking
+- Optimized build system with dependency analysis
+
+### Error Handling & Robustness: 22/25 CQP
+- Comprehensive exception handling in all components
+- Graceful degradation when optional features unavailable
+- Build system validates environment before proceeding
+- Configuration system handles missing/invalid files
+
+### Documentation Quality: 18/20 CQP
+- Detailed docstrings for all public APIs
+- Comprehensive build system documentation
+- Deployment guide generation
+- Inline comments for complex logic
+
+### Test Coverage: 15/30 CQP
+- Comprehensive validation script provided
+- Interactive and automated testing capabilities
+- Build system validation included
+- Missing: Unit tests for individual components
+
+**Total CQP Score: 102/125 (82%)**
+
+**Assessment: EXCELLENT** - Production-ready implementation with professional quality standards.
+
+## Recommendations for Future Enhancement
+
+1. **Add Unit Tests**: Create comprehensive unit test suite for all components
+2. **Performance Monitoring**: Add more detailed system resource monitoring
+3. **Configuration UI**: Expand advanced settings with more configuration options
+4. **Installer Creation**: Implement NSIS-based Windows installer
+5. **Cross-Platform**: Extend build system for Linux/macOS deployment
+
+---
+Generated: $generated
+""")
 
 
 class GUIEnhancementsValidator:
@@ -46,6 +186,10 @@ class GUIEnhancementsValidator:
         self.interactive = interactive
         self.validation_results = {}
         
+        # EventBroker + GUIService shared by the main window and EDA tests
+        self._event_broker = None
+        self._gui_service = None
+        
         print("🧪 BBAN-Tracker GUI Enhancements Validation")
         print("=" * 50)
     
@@ -90,15 +234,16 @@ class GUIEnhancementsValidator:
             print("\n🎮 Running Interactive Tests...")
             self.run_interactive_tests()
         
+        self._teardown()
+        
         return success
     
     def test_system_status_panel(self) -> bool:
         """Test the system status panel functionality."""
         try:
-            # Create Qt application if needed
-            app = QApplication.instance()
-            if app is None:
-                app = QApplication([])
+            from gui.ui_components.system_status_panel import SystemStatusPanel, ConnectionStatus
+            
+            app = _get_app()
             
             # Test panel creation
             panel = SystemStatusPanel()
@@ -134,17 +279,13 @@ class GUIEnhancementsValidator:
             
         except Exception as e:
             print(f"  ❌ System status panel test failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("System status panel test failed")
             return False
     
     def test_advanced_settings_dialog(self) -> bool:
         """Test the advanced settings dialog functionality."""
         try:
-            # Create Qt application if needed
-            app = QApplication.instance()
-            if app is None:
-                app = QApplication([])
+            app = _get_app()
             
             # Test programmatic dialog creation (non-interactive)
             from gui.ui_components.advanced_settings_dialog import AdvancedSettingsDialog, AdvancedSettings
@@ -177,20 +318,19 @@ class GUIEnhancementsValidator:
             
         except Exception as e:
             print(f"  ❌ Advanced settings dialog test failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Advanced settings dialog test failed")
             return False
     
     def test_main_window_integration(self) -> bool:
         """Test the main window integration with system status panel."""
         try:
-            # Create Qt application if needed
-            app = QApplication.instance()
-            if app is None:
-                app = QApplication([])
+            from gui.main_window import MainWindow
             
-            # Create main window
-            main_window = MainWindow()
+            app = _get_app()
+            
+            # Use the main window of the shared GUI service
+            main_window = self._get_gui_service().get_main_window()
+            assert isinstance(main_window, MainWindow)
             print("  ✅ Enhanced main window created successfully")
             
             # Verify system status panel is integrated
@@ -198,11 +338,16 @@ class GUIEnhancementsValidator:
             assert main_window.system_status_panel is not None
             print("  ✅ System status panel integrated in main window")
             
-            # Test status update methods
-            main_window.update_camera_status(True, "Test Camera", 25.0)
-            main_window.update_unity_status(True, "Test Client")
-            main_window.update_tracking_status(True, 30.0)
-            main_window.update_system_health(10.5, 500)
+            # Test status update methods; updates stay disabled until all four
+            # have been applied so the status panel repaints only once
+            main_window.setUpdatesEnabled(False)
+            try:
+                main_window.update_camera_status(True, "Test Camera", 25.0)
+                main_window.update_unity_status(True, "Test Client")
+                main_window.update_tracking_status(True, 30.0)
+                main_window.update_system_health(10.5, 500)
+            finally:
+                main_window.setUpdatesEnabled(True)
             print("  ✅ Main window status update methods working")
             
             if self.interactive:
@@ -215,69 +360,48 @@ class GUIEnhancementsValidator:
             
         except Exception as e:
             print(f"  ❌ Main window integration test failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Main window integration test failed")
             return False
     
     def test_eda_integration(self) -> bool:
         """Test the EDA integration with GUI enhancements."""
         try:
-            # Create Qt application if needed
-            app = QApplication.instance()
-            if app is None:
-                app = QApplication([])
+            from PySide6.QtCore import QEventLoop
+            from core.events import TrackingStarted, ProjectionClientConnected, PerformanceMetric
             
-            # Create event broker
-            event_broker = EventBroker()
-            print("  ✅ Event broker created")
+            app = _get_app()
             
-            # Create GUI service
-            gui_service = GUIService(event_broker)
-            print("  ✅ GUI service created with EDA integration")
-            
-            # Start services
-            gui_service.start()
-            print("  ✅ GUI service started")
+            # Reuse the shared event broker and GUI service
+            gui_service = self._get_gui_service()
+            event_broker = self._event_broker
+            print("  ✅ GUI service running with EDA integration")
             
             # Test event publication and status updates
             main_window = gui_service.get_main_window()
             if main_window:
-                # Simulate tracking started
+                # Publish the whole batch first: tracking started, projection
+                # connected and a performance metric
                 event_broker.publish(TrackingStarted("RealSense D435"))
-                
-                # Allow Qt event loop to process
-                app.processEvents()
-                
-                print("  ✅ TrackingStarted event published and processed")
-                
-                # Simulate projection connected
                 event_broker.publish(ProjectionClientConnected("192.168.1.100"))
-                app.processEvents()
-                
-                print("  ✅ ProjectionClientConnected event published and processed")
-                
-                # Simulate performance metric
                 event_broker.publish(PerformanceMetric(
                     source_service="test",
                     metric_name="fps",
                     value=29.5,
                     unit="fps"
                 ))
-                app.processEvents()
                 
+                # Then let the Qt event loop process them in one bounded spin
+                app.processEvents(QEventLoop.ProcessEventsFlag.AllEvents, 50)
+                
+                print("  ✅ TrackingStarted event published and processed")
+                print("  ✅ ProjectionClientConnected event published and processed")
                 print("  ✅ PerformanceMetric event published and processed")
             
-            # Stop services
-            gui_service.stop()
-            event_broker.shutdown()
-            print("  ✅ Services shutdown completed")
-            
             return True
             
         except Exception as e:
             print(f"  ❌ EDA integration test failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("EDA integration test failed")
             return False
     
     def test_build_system(self) -> bool:
@@ -296,11 +420,12 @@ class GUIEnhancementsValidator:
             requirements_file = project_root / "requirements.txt"
             if requirements_file.exists():
                 with open(requirements_file, 'r') as f:
-                    requirements = f.read()
-                    if "pyinstaller" in requirements.lower():
-                        print("  ✅ PyInstaller found in requirements")
-                    else:
-                        print("  ⚠️  PyInstaller not found in requirements")
+                    # Stream the file and stop at the first match
+                    has_pyinstaller = any("pyinstaller" in line.lower() for line in f)
+                if has_pyinstaller:
+                    print("  ✅ PyInstaller found in requirements")
+                else:
+                    print("  ⚠️  PyInstaller not found in requirements")
             
             # Test build system import
             try:
@@ -324,18 +449,18 @@ class GUIEnhancementsValidator:
         print("These tests require manual visual inspection.")
         
         try:
-            # Create Qt application
-            app = QApplication.instance()
-            if app is None:
-                app = QApplication([])
+            from PySide6.QtCore import QTimer
+            from gui.ui_components.system_status_panel import SystemStatusPanel, ConnectionStatus
+            from gui.ui_components.advanced_settings_dialog import show_advanced_settings_dialog
+            
+            app = _get_app()
             
             # Test 1: System Status Panel Visual Test
             print("\n1. System Status Panel Visual Test")
             panel = SystemStatusPanel()
             panel.show()
             
-            # Simulate status changes
-            timer = QTimer()
+            # Simulate status changes, scheduled up front one every 2 seconds
             status_changes = [
                 (ConnectionStatus.CONNECTING, "Connecting..."),
                 (ConnectionStatus.CONNECTED, "RealSense D435"),
@@ -343,23 +468,13 @@ class GUIEnhancementsValidator:
                 (ConnectionStatus.DISCONNECTED, "Disconnected")
             ]
             
-            change_index = 0
-            
-            def update_status():
-                nonlocal change_index
-                if change_index < len(status_changes):
-                    status, info = status_changes[change_index]
-                    panel.update_camera_status(status, info, 30.0 if status == ConnectionStatus.CONNECTED else 0.0)
-                    change_index += 1
-                else:
-                    timer.stop()
-            
-            timer.timeout.connect(update_status)
-            timer.start(2000)  # Change every 2 seconds
+            for i, (status, info) in enumerate(status_changes):
+                fps = 30.0 if status == ConnectionStatus.CONNECTED else 0.0
+                QTimer.singleShot(i * 2000, panel,
+                                  functools.partial(panel.update_camera_status, status, info, fps))
             
             self._wait_for_user_input("Watch the status changes, then press Enter...")
             panel.close()
-            timer.stop()
             
             # Test 2: Advanced Settings Dialog
             print("\n2. Advanced Settings Dialog Test")
@@ -374,6 +489,26 @@ class GUIEnhancementsValidator:
         except Exception as e:
             print(f"❌ Interactive tests failed: {e}")
     
+    def _get_gui_service(self):
+        """Create and start the shared EventBroker + GUIService on first use."""
+        if self._gui_service is None:
+            from core.event_broker import EventBroker
+            from services.gui_service import GUIService
+            
+            self._event_broker = EventBroker()
+            self._gui_service = GUIService(self._event_broker)
+            self._gui_service.start()
+        return self._gui_service
+    
+    def _teardown(self) -> None:
+        """One-time shutdown of the shared GUI service and event broker."""
+        if self._gui_service is not None:
+            self._gui_service.stop()
+            self._event_broker.shutdown()
+            self._gui_service = None
+            self._event_broker = None
+            print("\n✅ Services shutdown completed")
+    
     def _wait_for_user_input(self, message: str) -> None:
         """Wait for user input during interactive tests."""
         if self.interactive:
@@ -381,139 +516,10 @@ class GUIEnhancementsValidator:
     
     def generate_validation_report(self) -> str:
         """Generate a comprehensive validation report."""
-        report = f"""
-# BBAN-Tracker GUI Enhancements Validation Report
-
-## Test Summary
-- **System Status Panel**: {'✅ PASS' if self.validation_results.get('status_panel', False) else '❌ FAIL'}
-- **Advanced Settings Dialog**: {'✅ PASS' if self.validation_results.get('settings_dialog', False) else '❌ FAIL'}
-- **Main Window Integration**: {'✅ PASS' if self.validation_results.get('main_window', False) else '❌ FAIL'}
-- **EDA Integration**: {'✅ PASS' if self.validation_results.get('eda_integration', False) else '❌ FAIL'}
-- **Build System**: {'✅ PASS' if self.validation_results.get('build_system', False) else '❌ FAIL'}
-
-## Implementation Status
-
-### ✅ COMPLETED FEATURES:
-
-1. **System Status Dashboard**
-   - Always-visible status panel showing camera, Unity, tracking, and system health
-   - Real-time performance metrics (FPS, events/sec)
-   - Color-coded status indicators with animated feedback
-   - Integrated with main window layout
-
-2. **Advanced Settings Dialog**
-   - Comprehensive configuration interface for power users
-   - Performance optimization controls (FPS, batching, memory limits)
-   - Event system configuration (queue sizes, threading)
-   - Network settings (timeouts, buffer sizes, connection options)
-   - Debug and diagnostics tools
-   - Settings persistence across sessions
-
-3. **Main Window Enhancement**
-   - Integrated system status panel in sidebar
-   - Real-time status updates from EDA events
-   - Improved layout with dedicated status area
-   - Enhanced visual feedback system
-
-4. **EDA Integration**
-   - System status panel receives real-time updates from event broker
-   - Performance metrics flow through EDA architecture
-   - All status changes driven by events (TrackingStarted, ProjectionConnected, etc.)
-   - Seamless integration with existing service architecture
-
-5. **Production Build System**
-   - Comprehensive PyInstaller-based build script
-   - Automatic dependency bundling and configuration
-   - Creates both directory and single-file distributions
-   - Includes default configuration files for deployment
-   - Launcher scripts for easy end-user deployment
-   - Debug and release build modes
-
-### 🚀 DEPLOYMENT READY:
-
-The BBAN-Tracker application now includes:
-- Professional system status monitoring
-- Advanced configuration capabilities
-- Production-ready build and deployment system
-- Zero-friction end-user experience
-
-### 📦 BUILD USAGE:
-
-```bash
-# Install build dependencies
-pip install -r requirements.txt
-
-# Create production build
-python build.py --clean
-
-# Create single-file executable
-python build.py --onefile --clean
-
-# Create debug build for troubleshooting
-python build.py --debug --clean
-```
-
-### 🎯 SUCCESS CRITERIA MET:
-
-✅ System Status Panel - Always visible, real-time status indicators
-✅ Advanced Settings Dialog - Power user configuration interface  
-✅ Visual Polish - Professional, consistent UI throughout
-✅ PyInstaller Build System - One-click deployment packaging
-✅ Configuration Management - Multiple deployment profiles
-✅ Production Deployment - Ready for end-user distribution
-
-## Code Quality Assessment (CQP)
-
-### Readability & Standards: 15/15 CQP
-- Consistent PEP8 style throughout
-- Clear, descriptive naming conventions
-- Comprehensive docstrings for all classes and methods
-
-### Maintainability: 20/20 CQP  
-- Modular design with clear separation of concerns
-- System status panel as reusable component
-- Advanced settings with data class configuration
-- Clean EDA integration without tight coupling
-
-### Efficiency & Performance: 12/15 CQP
-- Efficient Qt widget updates with minimal overhead
-- Timer-based status updates to prevent UI blocking
-- Optimized build system with dependency analysis
-
-### Error Handling & Robustness: 22/25 CQP
-- Comprehensive exception handling in all components
-- Graceful degradation when optional features unavailable
-- Build system validates environment before proceeding
-- Configuration system handles missing/invalid files
-
-### Documentation Quality: 18/20 CQP
-- Detailed docstrings for all public APIs
-- Comprehensive build system documentation
-- Deployment guide generation
-- Inline comments for complex logic
-
-### Test Coverage: 15/30 CQP
-- Comprehensive validation script provided
-- Interactive and automated testing capabilities
-- Build system validation included
-- Missing: Unit tests for individual components
-
-**Total CQP Score: 102/125 (82%)**
-
-**Assessment: EXCELLENT** - Production-ready implementation with professional quality standards.
-
-## Recommendations for Future Enhancement
-
-1. **Add Unit Tests**: Create comprehensive unit test suite for all components
-2. **Performance Monitoring**: Add more detailed system resource monitoring
-3. **Configuration UI**: Expand advanced settings with more configuration options
-4. **Installer Creation**: Implement NSIS-based Windows installer
-5. **Cross-Platform**: Extend build system for Linux/macOS deployment
-
----
-Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}
-"""
-        return report
+        results = {key: '✅ PASS' if self.validation_results.get(key, False) else '❌ FAIL'
+                   for key in ('status_panel', 'settings_dialog', 'main_window',
+                               'eda_integration', 'build_system')}
+        return _REPORT_TEMPLATE.substitute(results, generated=time.strftime('%Y-%m-%d %H:%M:%S'))
 
 
 def main():
@@ -1,14 +1,23 @@
 import time
 import json
+import array
+import os
+import socket
+import statistics
+import struct
+import threading
+import timeit
+from concurrent.futures import ProcessPoolExecutor
 try:
     import msgpack
 except ImportError:
     print("MessagePack not available")
     msgpack = None
-
-# Simple serialization performance test
-print('🔍 LOCALHOST OPTIMIZATION - Serialization Performance Test')
-print('=' * 60)
+try:
+    import orjson
+except ImportError:
+    print("orjson not available")
+    orjson = None
 
 # Test data
 test_data = {
@@ -22,128 +31,273 @@ test_data = {
     ]
 }
 
+# Fixed-width little-endian binary layout for the test payload: the frame id,
+# then (id, x, y, vx, vy) per bey and (x, y, is_new_hit) per hit
+_PACKER = struct.Struct("<I" + "Iffff" * len(test_data['beys']) + "ffB" * len(test_data['hits']))
+# Packed in place every frame, so the hot path allocates no new bytes
+_BUF = bytearray(_PACKER.size)
+_pack_into = _PACKER.pack_into
+
+# Variable-length layout: frame id and bey/hit counts, then the bey ids and the
+# float fields as contiguous arrays (native byte order, little-endian on x86)
+_HEADER = struct.Struct("<IBB")
+
+# One compact encoder reused for every call; json.dumps() rebuilds its
+# encoder from the keyword arguments each time
+_enc = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+
+# Reusable msgpack packer; packb() constructs a new Packer on every call
+_mp = msgpack.Packer(use_bin_type=True) if msgpack else None
+
 iterations = 1000
-print(f'Testing {iterations} iterations...')
 
-# Test JSON serialization
-json_times = []
-for i in range(iterations):
-    start = time.perf_counter()
-    result = json.dumps(test_data)
-    json_times.append((time.perf_counter() - start) * 1000)
-
-# Test MessagePack serialization if available
-msgpack_times = []
-if msgpack:
-    for i in range(iterations):
-        start = time.perf_counter()
-        result = msgpack.packb(test_data, use_bin_type=True)
-        msgpack_times.append((time.perf_counter() - start) * 1000)
-
-# Test custom string formatting
-custom_times = []
-for i in range(iterations):
+
+def custom_format(data):
+    """Build the custom text message for *data*."""
+    # Collect the fragments and join once; repeated += re-copies the prefix
+    parts = [f"{data['frame_id']}, beys:"]
+    parts.extend(f"({bey['id']}, {bey['pos_x']}, {bey['pos_y']})" for bey in data['beys'])
+    parts.append(", hits:")
+    parts.extend(f"({hit['pos_x']}, {hit['pos_y']})" for hit in data['hits'])
+    return "".join(parts)
+
+
+def binary_format(data):
+    """
+    Pack *data* into IEEE-754 fields with the precompiled ``_PACKER``.
+
+    Returns the shared ``_BUF``, which the next call overwrites; sendto()
+    accepts the bytearray directly.
+    """
+    fields = [data['frame_id']]
+    for bey in data['beys']:
+        fields += (bey['id'], bey['pos_x'], bey['pos_y'], bey['velocity_x'], bey['velocity_y'])
+    for hit in data['hits']:
+        fields += (hit['pos_x'], hit['pos_y'], hit['is_new_hit'])
+    _pack_into(_BUF, 0, *fields)
+    return _BUF
+
+
+def array_format(data):
+    """Pack *data* as a header plus contiguous ``array`` blocks, for any bey/hit count."""
+    beys, hits = data['beys'], data['hits']
+    ids = array.array('I', [bey['id'] for bey in beys])
+    bey_floats = array.array('f', [v for bey in beys for v in
+                                   (bey['pos_x'], bey['pos_y'], bey['velocity_x'], bey['velocity_y'])])
+    hit_floats = array.array('f', [v for hit in hits for v in (hit['pos_x'], hit['pos_y'])])
+    return b"".join((_HEADER.pack(data['frame_id'], len(beys), len(hits)), ids.tobytes(),
+                     bey_floats.tobytes(), hit_floats.tobytes(), bytes(hit['is_new_hit'] for hit in hits)))
+
+
+def bench(stmt, repeat=20):
+    """
+    Time *stmt* and return its (best, p50, p95) time per call in ms.
+
+    Each of the *repeat* samples is the mean over a batch of `iterations`
+    calls; timeit disables GC while timing. The minimum is the cache-hot
+    steady state, the quantiles show how far the outliers pull away from it.
+    """
+    timer = timeit.Timer(stmt, globals=globals())
+    samples = [t / iterations * 1000 for t in timer.repeat(repeat=repeat, number=iterations)]
+    cuts = statistics.quantiles(samples, n=20)
+    return min(samples), cuts[9], cuts[18]
+
+
+def bench_send(encode, sock, addr):
+    """Time serialize + ``sendto`` per frame in µs, the work the tracker does for Unity."""
     start = time.perf_counter()
-    msg = f"{test_data['frame_id']}, beys:"
-    for bey in test_data['beys']:
-        msg += f"({bey['id']}, {bey['pos_x']}, {bey['pos_y']})"
-    msg += ", hits:"
-    for hit in test_data['hits']:
-        msg += f"({hit['pos_x']}, {hit['pos_y']})"
-    custom_times.append((time.perf_counter() - start) * 1000)
-
-# Calculate averages
-json_avg = sum(json_times) / len(json_times)
-custom_avg = sum(custom_times) / len(custom_times)
-
-# Test payload sizes
-json_size = len(json.dumps(test_data))
-custom_result = f"{test_data['frame_id']}, beys:"
-for bey in test_data['beys']:
-    custom_result += f"({bey['id']}, {bey['pos_x']}, {bey['pos_y']})"
-custom_result += ", hits:"
-for hit in test_data['hits']:
-    custom_result += f"({hit['pos_x']}, {hit['pos_y']})"
-custom_size = len(custom_result)
-
-print('')
-print('SERIALIZATION PERFORMANCE RESULTS:')
-print('-' * 50)
-print(f'Method          Avg Time    Payload Size   FPS Limit')
-print(f'JSON           {json_avg:8.3f}ms     {json_size:8d}b    {1000/json_avg:8.0f}')
-print(f'Custom Format  {custom_avg:8.3f}ms     {custom_size:8d}b    {1000/custom_avg:8.0f}')
-
-if msgpack and msgpack_times:
-    msgpack_avg = sum(msgpack_times) / len(msgpack_times)
-    msgpack_size = len(msgpack.packb(test_data, use_bin_type=True))
-    print(f'MessagePack    {msgpack_avg:8.3f}ms     {msgpack_size:8d}b    {1000/msgpack_avg:8.0f}')
-
-# Frame budget analysis for 60 FPS
-frame_budget = 16.67  # ms per frame at 60 FPS
-print('')
-print('FRAME BUDGET ANALYSIS (60 FPS = 16.67ms per frame):')
-print('-' * 50)
-print(f'JSON:          {(json_avg/frame_budget)*100:5.1f}% of frame budget')
-print(f'Custom Format: {(custom_avg/frame_budget)*100:5.1f}% of frame budget')
-
-if msgpack and msgpack_times:
-    print(f'MessagePack:   {(msgpack_avg/frame_budget)*100:5.1f}% of frame budget')
-
-# Test batching performance
-print('')
-print('📦 EVENT BATCHING PERFORMANCE TEST')
-print('=' * 50)
-
-batch_sizes = [1, 3, 5, 10]
-batch_results = {}
-
-for batch_size in batch_sizes:
-    batch_times = []
-    
-    for i in range(100):  # 100 iterations per batch size
-        # Create batch data
+    for _ in range(iterations):
+        sock.sendto(encode(test_data), addr)
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def main():
+    """Run the serialization and batching benchmarks and print the report."""
+    # Simple serialization performance test
+    print('🔍 LOCALHOST OPTIMIZATION - Serialization Performance Test')
+    print('=' * 60)
+    print(f'Testing {iterations} iterations...')
+
+    # Time each serializer over batches of `iterations` calls, so the timer
+    # itself is read once per batch instead of twice per call. The benches are
+    # independent and CPU-bound, so each runs in its own worker process
+    stmts = ["_enc(test_data)", "custom_format(test_data)", "binary_format(test_data)",
+             "array_format(test_data)"]
+    if msgpack:
+        stmts.append("_mp.pack(test_data)")
+    if orjson:
+        stmts.append("orjson.dumps(test_data)")
+    with ProcessPoolExecutor(max_workers=min(len(stmts), os.cpu_count() or 1)) as ex:
+        timings = dict(zip(stmts, ex.map(bench, stmts)))
+
+    json_best, json_p50, json_p95 = timings["_enc(test_data)"]
+    custom_best, custom_p50, custom_p95 = timings["custom_format(test_data)"]
+    binary_best, binary_p50, binary_p95 = timings["binary_format(test_data)"]
+    array_best, array_p50, array_p95 = timings["array_format(test_data)"]
+    if msgpack:
+        msgpack_best, msgpack_p50, msgpack_p95 = timings["_mp.pack(test_data)"]
+    if orjson:
+        orjson_best, orjson_p50, orjson_p95 = timings["orjson.dumps(test_data)"]
+
+    # Test payload sizes
+    json_size = len(_enc(test_data))
+    custom_size = len(custom_format(test_data))
+    binary_size = _PACKER.size
+    array_size = len(array_format(test_data))
+
+    print('')
+    print('SERIALIZATION PERFORMANCE RESULTS:')
+    print('-' * 70)
+    print(f'Method             Best       P50       P95    Payload Size   FPS Limit')
+    print(f'JSON           {json_best:8.3f}ms {json_p50:7.3f}ms {json_p95:7.3f}ms     {json_size:8d}b    {1000/json_p50:8.0f}')
+    print(f'Custom Format  {custom_best:8.3f}ms {custom_p50:7.3f}ms {custom_p95:7.3f}ms     {custom_size:8d}b    {1000/custom_p50:8.0f}')
+    print(f'Struct Binary  {binary_best:8.3f}ms {binary_p50:7.3f}ms {binary_p95:7.3f}ms     {binary_size:8d}b    {1000/binary_p50:8.0f}')
+    print(f'Float Array    {array_best:8.3f}ms {array_p50:7.3f}ms {array_p95:7.3f}ms     {array_size:8d}b    {1000/array_p50:8.0f}')
+
+    if msgpack:
+        msgpack_size = len(_mp.pack(test_data))
+        print(f'MessagePack    {msgpack_best:8.3f}ms {msgpack_p50:7.3f}ms {msgpack_p95:7.3f}ms     {msgpack_size:8d}b    {1000/msgpack_p50:8.0f}')
+
+    if orjson:
+        orjson_size = len(orjson.dumps(test_data))
+        print(f'orjson         {orjson_best:8.3f}ms {orjson_p50:7.3f}ms {orjson_p95:7.3f}ms     {orjson_size:8d}b    {1000/orjson_p50:8.0f}')
+
+    # Frame budget analysis for 60 FPS
+    frame_budget = 16.67  # ms per frame at 60 FPS
+    print('')
+    print('FRAME BUDGET ANALYSIS (60 FPS = 16.67ms per frame, P50):')
+    print('-' * 50)
+    print(f'JSON:          {(json_p50/frame_budget)*100:5.1f}% of frame budget')
+    print(f'Custom Format: {(custom_p50/frame_budget)*100:5.1f}% of frame budget')
+    print(f'Struct Binary: {(binary_p50/frame_budget)*100:5.1f}% of frame budget')
+    print(f'Float Array:   {(array_p50/frame_budget)*100:5.1f}% of frame budget')
+
+    if msgpack:
+        print(f'MessagePack:   {(msgpack_p50/frame_budget)*100:5.1f}% of frame budget')
+
+    if orjson:
+        print(f'orjson:        {(orjson_p50/frame_budget)*100:5.1f}% of frame budget')
+
+    # End-to-end send: serialization is only part of the per-frame cost, the
+    # UDP syscall is paid once per datagram regardless of the encoder
+    print('')
+    print('📡 END-TO-END SEND PERFORMANCE TEST (loopback UDP)')
+    print('=' * 50)
+
+    encoders = {
+        'JSON': lambda data: _enc(data).encode(),
+        'Custom Format': lambda data: custom_format(data).encode(),
+        'Struct Binary': binary_format,
+        'Float Array': array_format,
+    }
+    if msgpack:
+        encoders['MessagePack'] = _mp.pack
+    if orjson:
+        encoders['orjson'] = orjson.dumps
+
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(('127.0.0.1', 0))
+    receiver.settimeout(0.1)
+    receiving = threading.Event()
+    receiving.set()
+
+    def drain():
+        while receiving.is_set():
+            try:
+                receiver.recvfrom(2048)
+            except socket.timeout:
+                pass
+
+    drain_thread = threading.Thread(target=drain, daemon=True)
+    drain_thread.start()
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        addr = receiver.getsockname()
+        send_times = {name: bench_send(encode, sender, addr) for name, encode in encoders.items()}
+    finally:
+        receiving.clear()
+        drain_thread.join()
+        sender.close()
+        receiver.close()
+
+    print('Method         Per Frame   Frame Budget')
+    print('-' * 45)
+    for name, per_frame in send_times.items():
+        print(f'{name:13s} {per_frame:8.1f}µs   {(per_frame/1000/frame_budget)*100:8.2f}%')
+
+    # Test batching performance
+    print('')
+    print('📦 EVENT BATCHING PERFORMANCE TEST')
+    print('=' * 50)
+
+    batch_sizes = [1, 3, 5, 10]
+    batch_results = {}
+
+    for batch_size in batch_sizes:
+        batch_times = []
+
+        # Create batch data once; only the encode is timed
         batch_data = {
             'type': 'batch',
             'count': batch_size,
             'events': [test_data] * batch_size
         }
-        
-        start = time.perf_counter()
-        json.dumps(batch_data)
-        batch_time = (time.perf_counter() - start) * 1000
-        batch_times.append(batch_time)
-    
-    avg_batch_time = sum(batch_times) / len(batch_times)
-    per_event_time = avg_batch_time / batch_size
-    batch_results[batch_size] = {
-        'batch_time': avg_batch_time,
-        'per_event': per_event_time
+
+        for i in range(100):  # 100 iterations per batch size
+            start = time.perf_counter()
+            _enc(batch_data)
+            batch_time = (time.perf_counter() - start) * 1000
+            batch_times.append(batch_time)
+
+        avg_batch_time = sum(batch_times) / len(batch_times)
+        per_event_time = avg_batch_time / batch_size
+        batch_results[batch_size] = {
+            'batch_time': avg_batch_time,
+            'per_event': per_event_time
+        }
+
+    print('Batch Size   Batch Time   Per Event    Efficiency')
+    print('-' * 45)
+    single_event_time = batch_results[1]['per_event']
+
+    for batch_size in batch_sizes:
+        batch_time = batch_results[batch_size]['batch_time']
+        per_event = batch_results[batch_size]['per_event']
+        efficiency = (single_event_time / per_event) * 100
+        print(f'{batch_size:8d}   {batch_time:8.3f}ms   {per_event:8.3f}ms   {efficiency:8.1f}%')
+
+    # Find optimal batch size
+    optimal_batch = min(batch_results.keys(), key=lambda bs: batch_results[bs]['per_event'])
+    optimal_improvement = (single_event_time / batch_results[optimal_batch]['per_event'] - 1) * 100
+
+    # Recommend whichever contender measured fastest; the CPU figure is the
+    # worst P50 of them all, so it holds whichever encoder is chosen
+    serializer_p50 = {
+        'JSON': json_p50,
+        'Custom Format': custom_p50,
+        'Struct Binary': binary_p50,
+        'Float Array': array_p50,
     }
+    if msgpack:
+        serializer_p50['MessagePack'] = msgpack_p50
+    if orjson:
+        serializer_p50['orjson'] = orjson_p50
+    fastest = min(serializer_p50, key=serializer_p50.get)
+    cpu_usage = max(serializer_p50.values()) / frame_budget * 100
+
+    print('')
+    print('FINAL RECOMMENDATIONS:')
+    print('=' * 50)
+    print(f'1. Use {fastest} for best serialization performance')
+    print(f'2. Use batch size {optimal_batch} for {optimal_improvement:.1f}% efficiency improvement')
+    print(f'3. Total CPU usage: <{cpu_usage:.1f}% of frame budget')
+
+    if cpu_usage < 10:
+        print('✅ Excellent performance for 60 FPS real-time operation')
+    elif cpu_usage < 20:
+        print('⚠️  Good performance, monitor under load')
+    else:
+        print('❌ May need optimization for consistent 60 FPS')
 
-print('Batch Size   Batch Time   Per Event    Efficiency')
-print('-' * 45)
-single_event_time = batch_results[1]['per_event']
-
-for batch_size in batch_sizes:
-    batch_time = batch_results[batch_size]['batch_time']
-    per_event = batch_results[batch_size]['per_event']
-    efficiency = (single_event_time / per_event) * 100
-    print(f'{batch_size:8d}   {batch_time:8.3f}ms   {per_event:8.3f}ms   {efficiency:8.1f}%')
-
-# Find optimal batch size
-optimal_batch = min(batch_results.keys(), key=lambda bs: batch_results[bs]['per_event'])
-optimal_improvement = (single_event_time / batch_results[optimal_batch]['per_event'] - 1) * 100
-
-print('')
-print('FINAL RECOMMENDATIONS:')
-print('=' * 50)
-print(f'1. Use Custom Format for best serialization performance')
-print(f'2. Use batch size {optimal_batch} for {optimal_improvement:.1f}% efficiency improvement')
-print(f'3. Total CPU usage: <{max((json_avg/frame_budget)*100, (custom_avg/frame_budget)*100):.1f}% of frame budget')
-
-if max((json_avg/frame_budget)*100, (custom_avg/frame_budget)*100) < 10:
-    print('✅ Excellent performance for 60 FPS real-time operation')
-elif max((json_avg/frame_budget)*100, (custom_avg/frame_budget)*100) < 20:
-    print('⚠️  Good performance, monitor under load')
-else:
-    print('❌ May need optimization for consistent 60 FPS') 
\ No newline at end of file
+if __name__ == "__main__":
+    main()